@@ -3,6 +3,16 @@
 __version__ = "2.0.12"
 
 from backend.client import WeatherClient
-from backend.models import Location, WeatherData
+from backend.exceptions import LocationNotFoundError, ParsingError, UpstreamError, WeatherError
+from backend.models import HourlyForecast, Location, WeatherData
 
-__all__ = ["WeatherClient", "WeatherData", "Location"]
+__all__ = [
+    "WeatherClient",
+    "WeatherData",
+    "HourlyForecast",
+    "Location",
+    "WeatherError",
+    "UpstreamError",
+    "ParsingError",
+    "LocationNotFoundError",
+]
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
+import logging
 import os
-import secrets
 
 from dotenv import load_dotenv
 
-DEFAULT_SECRET_KEY_PLACEHOLDER = "change-this-to-a-secure-random-key-in-production"  # nosec B105
-
 if os.path.exists("/app/.env.production"):
     load_dotenv("/app/.env.production")
 else:
@@ -21,16 +19,34 @@ TESTING = os.getenv("TESTING", "0") == "1"
 HOST = os.getenv("HOST", "0.0.0.0")  # nosec B104
 PORT = int(os.getenv("PORT", "5000"))
 
+# Requests slower than this are logged at INFO; other successful requests only at DEBUG.
+SLOW_REQUEST_SECONDS = float(os.getenv("SLOW_REQUEST_SECONDS", "1.0"))
+
 RATE_LIMIT_PER_IP = os.getenv("RATE_LIMIT_PER_IP", "30")
 RATE_LIMIT_GLOBAL = os.getenv("RATE_LIMIT_GLOBAL", "200")
 
+# Successful readiness checks are reused for this long so frequent probes do not hit MSN.
+READINESS_CACHE_SECONDS = float(os.getenv("READINESS_CACHE_SECONDS", "5"))
+
 MAX_INPUT_LENGTH = int(os.getenv("MAX_INPUT_LENGTH", "100"))
 MAX_CITY_LENGTH = MAX_INPUT_LENGTH
 MAX_COUNTRY_LENGTH = MAX_INPUT_LENGTH
+# POST bodies larger than this are rejected with 413 before any JSON parsing.
+MAX_REQUEST_BODY_BYTES = int(os.getenv("MAX_REQUEST_BODY_BYTES", "4096"))
 
 CACHE_SIZE = int(os.getenv("CACHE_SIZE", "1000"))
-# CACHE_DURATION env var is expressed in seconds; convert to minutes for bucket arithmetic.
-CACHE_DURATION_MINUTES = int(os.getenv("CACHE_DURATION", "300")) // 60
+# Upper bound on sessions with stored recent searches; least recently used are evicted.
+RECENT_SEARCH_SESSIONS = int(os.getenv("RECENT_SEARCH_SESSIONS", "10000"))
+# CACHE_DURATION env var is expressed in seconds.
+CACHE_DURATION_SECONDS = int(os.getenv("CACHE_DURATION", "300"))
+CACHE_DURATION_MINUTES = CACHE_DURATION_SECONDS // 60
+
+
+def get_log_level() -> str:
+    """Return the configured log level name, falling back to INFO for unknown names."""
+    level_name = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+    # getLevelName maps a known level name to its number and echoes unknown names back
+    return level_name if isinstance(logging.getLevelName(level_name), int) else "INFO"
 
 
 def get_cors_origins() -> list[str]:
@@ -39,19 +55,3 @@ def get_cors_origins() -> list[str]:
     if raw_value.strip() == "*":
         return ["*"]
     return [origin.strip() for origin in raw_value.split(",") if origin.strip()]
-
-
-def get_secret_key() -> str:
-    """Resolve the app secret key with secure development fallback."""
-    secret_key = os.getenv("APP_SECRET_KEY")
-
-    if secret_key and secret_key != DEFAULT_SECRET_KEY_PLACEHOLDER:
-        return secret_key
-
-    if ENVIRONMENT == "development" or DEBUG or TESTING:
-        return secrets.token_hex(32)
-
-    raise ValueError(
-        "APP_SECRET_KEY must be set in production. "
-        "Generate one with: python -c 'import secrets; print(secrets.token_hex(32))'"
-    )
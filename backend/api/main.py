@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import re
+import secrets
 import time
-import uuid
 from collections import defaultdict, deque
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -12,8 +12,6 @@ from threading import Lock
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.sessions import SessionMiddleware
 
 from backend.api.config import (
     DEBUG,
@@ -21,13 +19,21 @@ from backend.api.config import (
     PORT,
     RATE_LIMIT_GLOBAL,
     RATE_LIMIT_PER_IP,
+    SLOW_REQUEST_SECONDS,
     TESTING,
     get_cors_origins,
-    get_secret_key,
 )
+from backend.api.responses import OrjsonResponse
 from backend.api.routers.health import router as health_router
 from backend.api.routers.weather import router as weather_router
-from backend.api.services import close_client, logger
+from backend.api.services import (
+    SESSION_COOKIE_NAME,
+    close_client,
+    configure_logging,
+    logger,
+)
+
+RATE_LIMIT_PATTERN = re.compile(r"\s*(\d+)\s+per\s+(minute|hour)\s*", re.IGNORECASE)
 
 
 class _InMemoryRateLimiter:
@@ -42,7 +48,7 @@ class _InMemoryRateLimiter:
 
     @staticmethod
     def _parse_limit(limit_value: str, *, default_window: int) -> tuple[int, int]:
-        match = re.match(r"^\s*(\d+)\s+per\s+(minute|hour)\s*$", limit_value, re.IGNORECASE)
+        match = RATE_LIMIT_PATTERN.fullmatch(limit_value)
         if not match:
             return int(limit_value), default_window
 
@@ -55,9 +61,9 @@ class _InMemoryRateLimiter:
         while bucket and now - bucket[0] >= window:
             bucket.popleft()
 
-    def check(self, request: Request) -> int | None:
-        """Return a retry-after value when the request should be limited."""
-        client_host = request.client.host if request.client else "anonymous"
+    def check(self, client_host: str | None) -> int | None:
+        """Return a retry-after value when a request from ``client_host`` should be limited."""
+        client_host = client_host or "anonymous"
         now = time.monotonic()
 
         with self._lock:
@@ -88,6 +94,7 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    configure_logging()
     app = FastAPI(
         title="MSN Weather Wrapper API",
         description=(
@@ -122,30 +129,18 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(
-        SessionMiddleware,
-        secret_key=get_secret_key(),
-        same_site="lax",
-        https_only=not DEBUG,
-    )
 
     @app.middleware("http")
     async def add_request_context(request: Request, call_next):  # type: ignore[no-untyped-def]
-        request_id = str(uuid.uuid4())
+        started_at = time.perf_counter()
+        request_id = secrets.token_hex(8)
         request.state.request_id = request_id
-
-        logger.info(
-            "request_started",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            ip=request.client.host if request.client else None,
-        )
+        client_ip = request.client.host if request.client else None
 
         if request.method != "OPTIONS" and not app.state.testing:
-            retry_after = rate_limiter.check(request)
+            retry_after = rate_limiter.check(client_ip)
             if retry_after is not None:
-                response = JSONResponse(
+                response = OrjsonResponse(
                     content={
                         "error": "Rate limit exceeded",
                         "message": "Too many requests. Please try again later.",
@@ -160,11 +155,32 @@ def create_app() -> FastAPI:
         response = await call_next(request)
         response.headers["X-Request-ID"] = request_id
 
-        logger.info(
+        # Only requests that start a recent-searches session need to set the cookie.
+        session_id = getattr(request.state, "session_id", None)
+        if session_id is not None:
+            response.set_cookie(
+                SESSION_COOKIE_NAME,
+                session_id,
+                httponly=True,
+                samesite="lax",
+                secure=not DEBUG,
+            )
+
+        # One line per request; routine fast successes are only visible at DEBUG.
+        duration = time.perf_counter() - started_at
+        log = (
+            logger.info
+            if response.status_code >= 400 or duration >= SLOW_REQUEST_SECONDS
+            else logger.debug
+        )
+        log(
             "request_completed",
             request_id=request_id,
-            status_code=response.status_code,
+            method=request.method,
             path=request.url.path,
+            ip=client_ip,
+            status_code=response.status_code,
+            duration_ms=round(duration * 1000, 1),
         )
         return response
 
@@ -2,30 +2,53 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+import time
+from typing import Any
 
+import orjson
+from fastapi import APIRouter, Response
+from starlette.concurrency import run_in_threadpool
+
+from backend.api.config import READINESS_CACHE_SECONDS
+from backend.api.responses import OrjsonResponse
 from backend.api.schemas import HealthResponse
 from backend.api.services import get_client
 
 router = APIRouter(tags=["health"])
 
+SERVICE_NAME = "MSN Weather Wrapper API"
+
+# Health and liveness payloads never change, so serialize them once at import.
+_HEALTH_BODY = orjson.dumps(
+    HealthResponse(status="ok", service=SERVICE_NAME, version="1.0").model_dump()
+)
+_LIVENESS_BODY = orjson.dumps(HealthResponse(status="alive", service=SERVICE_NAME).model_dump())
+
+# (expires_at, payload) of the last successful readiness check.
+_readiness_cache: tuple[float, dict[str, Any]] | None = None
+
 
 @router.get("/v1/health", response_model=HealthResponse)
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Return a basic service health response."""
-    return {"status": "ok", "service": "MSN Weather Wrapper API", "version": "1.0"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/v1/health/live", response_model=HealthResponse)
-async def liveness_probe() -> dict[str, str]:
+async def liveness_probe() -> Response:
     """Return a Kubernetes-friendly liveness probe response."""
-    return {"status": "alive", "service": "MSN Weather Wrapper API"}
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
 
 
 @router.get("/v1/health/ready", response_model=HealthResponse)
-async def readiness_probe() -> JSONResponse:
+async def readiness_probe() -> OrjsonResponse:
     """Return the service readiness state and dependency checks."""
+    global _readiness_cache
+
+    cached = _readiness_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return OrjsonResponse(content=cached[1], status_code=200)
+
     checks: dict[str, bool] = {}
     overall_ready = True
     client = None
@@ -40,7 +63,7 @@ async def readiness_probe() -> JSONResponse:
     try:
         if client is None:
             raise RuntimeError("weather client unavailable")
-        response = client.session.head("https://www.msn.com", timeout=2)
+        response = await run_in_threadpool(client.session.head, "https://www.msn.com", timeout=2)
         checks["external_api"] = response.status_code < 500
         if not checks["external_api"]:
             overall_ready = False
@@ -51,7 +74,9 @@ async def readiness_probe() -> JSONResponse:
     status_code = 200 if overall_ready else 503
     payload = {
         "status": "ready" if overall_ready else "not_ready",
-        "service": "MSN Weather Wrapper API",
+        "service": SERVICE_NAME,
         "checks": checks,
     }
-    return JSONResponse(content=payload, status_code=status_code)
+    if overall_ready:
+        _readiness_cache = (time.monotonic() + READINESS_CACHE_SECONDS, payload)
+    return OrjsonResponse(content=payload, status_code=status_code)
@@ -2,28 +2,39 @@
 
 from __future__ import annotations
 
+import hashlib
+import re
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Request, Response
-from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from backend.api.config import MAX_CITY_LENGTH, MAX_COUNTRY_LENGTH
+from backend.api.config import (
+    CACHE_DURATION_SECONDS,
+    MAX_CITY_LENGTH,
+    MAX_COUNTRY_LENGTH,
+    MAX_REQUEST_BODY_BYTES,
+)
+from backend.api.responses import OrjsonResponse
 from backend.api.schemas import MessageResponse, RecentSearchesResponse, WeatherResponse
 from backend.api.services import (
     add_to_recent_searches,
     build_weather_payload,
     clear_recent_search_history,
-    get_cached_weather,
     get_client,
-    get_minute_bucket,
     get_recent_search_history,
     logger,
+    lookup_weather,
     validate_input,
 )
 from backend.exceptions import LocationNotFoundError, UpstreamError, WeatherError
 
 router = APIRouter(tags=["weather"])
 
+# Plain decimal degrees only: rejects exponents, NaN/inf and oversized input before float().
+COORDINATE_PATTERN = re.compile(r"[+-]?\d{1,3}(?:\.\d{1,20})?")
+
 
 def _get_request_id(request: Request) -> str | None:
     value = getattr(request.state, "request_id", None)
@@ -35,15 +46,56 @@ def _invalid_request(
     *,
     error: str = "Invalid request",
     status_code: int = 400,
-) -> JSONResponse:
-    return JSONResponse(content={"error": error, "message": message}, status_code=status_code)
+) -> OrjsonResponse:
+    return OrjsonResponse(content={"error": error, "message": message}, status_code=status_code)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _weather_response(request: Request, payload: dict[str, Any]) -> Response:
+    """Return a successful weather payload with validators for client-side caching.
+
+    Stale payloads must be revalidated. Fresh ones may be reused for the cache duration.
+    Responses are ``private`` because they can carry the recent-searches session cookie.
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    cache_control = (
+        "no-cache" if payload.get("stale") else f"private, max-age={CACHE_DURATION_SECONDS}"
+    )
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
+def _parse_coordinate(value: str, limit: float) -> float | None:
+    """Return ``value`` as degrees within ``[-limit, limit]``, or ``None`` if invalid."""
+    if not COORDINATE_PATTERN.fullmatch(value):
+        return None
+    degrees = float(value)
+    return degrees if -limit <= degrees <= limit else None
 
-def _handle_weather_lookup(request: Request, city: Any, country: Any) -> JSONResponse:
+
+def _handle_weather_lookup(
+    request: Request, city: Any, country: Any, *, conditional: bool = False
+) -> Response:
+    """Validate a lookup and return the weather response.
+
+    ``conditional`` adds ETag/Cache-Control validators and 304 handling, which only GET may
+    use (RFC 9110 §13.1.2); POST responses are returned without them.
+    """
+    request_id = _get_request_id(request)
     if not city or not country:
         logger.warning(
             "missing_parameters",
-            request_id=_get_request_id(request),
+            request_id=request_id,
             city=city,
             country=country,
         )
@@ -56,7 +108,7 @@ def _handle_weather_lookup(request: Request, city: Any, country: Any) -> JSONRes
     if city_error:
         logger.warning(
             "invalid_city",
-            request_id=_get_request_id(request),
+            request_id=request_id,
             error=city_error,
         )
         return _invalid_request(city_error, error="Invalid input")
@@ -65,38 +117,33 @@ def _handle_weather_lookup(request: Request, city: Any, country: Any) -> JSONRes
     if country_error:
         logger.warning(
             "invalid_country",
-            request_id=_get_request_id(request),
+            request_id=request_id,
             error=country_error,
         )
         return _invalid_request(country_error, error="Invalid input")
 
-    logger.info(
-        "fetching_weather",
-        request_id=_get_request_id(request),
-        city=city,
-        country=country,
-    )
-
-    weather_data, status_code = get_cached_weather(city, country, get_minute_bucket())
+    weather_data, status_code = lookup_weather(city, country)
     if status_code == 200:
         add_to_recent_searches(request, city, country)
         logger.info(
             "weather_fetched_successfully",
-            request_id=_get_request_id(request),
+            request_id=request_id,
             city=city,
             country=country,
-            cached=True,
-        )
-    else:
-        logger.error(
-            "weather_fetch_failed",
-            request_id=_get_request_id(request),
-            city=city,
-            country=country,
-            status_code=status_code,
+            stale=bool(weather_data.get("stale")),
         )
+        if conditional:
+            return _weather_response(request, weather_data)
+        return OrjsonResponse(content=weather_data, status_code=status_code)
 
-    return JSONResponse(content=weather_data, status_code=status_code)
+    logger.error(
+        "weather_fetch_failed",
+        request_id=request_id,
+        city=city,
+        country=country,
+        status_code=status_code,
+    )
+    return OrjsonResponse(content=weather_data, status_code=status_code)
 
 
 @router.get("/v1/weather", response_model=WeatherResponse)
@@ -104,13 +151,27 @@ async def get_weather(
     request: Request,
     city: str | None = None,
     country: str | None = None,
-) -> JSONResponse:
+) -> Response:
     """Get weather data for a city and country."""
-    return _handle_weather_lookup(request, city, country)
+    return await run_in_threadpool(_handle_weather_lookup, request, city, country, conditional=True)
+
+
+async def _read_limited_body(request: Request) -> bytes | None:
+    """Read the request body, or return ``None`` once it exceeds ``MAX_REQUEST_BODY_BYTES``."""
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_REQUEST_BODY_BYTES:
+        return None
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_REQUEST_BODY_BYTES:
+            return None
+    return bytes(body)
 
 
 @router.post("/v1/weather", response_model=WeatherResponse)
-async def get_weather_post(request: Request) -> JSONResponse:
+async def get_weather_post(request: Request) -> Response:
     """Get weather data from a JSON request body."""
     content_type = request.headers.get("content-type", "")
     normalized_content_type = content_type.lower().split(";", maxsplit=1)[0].strip()
@@ -122,12 +183,20 @@ async def get_weather_post(request: Request) -> JSONResponse:
             status_code=415,
         )
 
+    body = await _read_limited_body(request)
+    if body is None:
+        return _invalid_request(
+            f"Request body length must not exceed {MAX_REQUEST_BODY_BYTES} bytes",
+            error="Request body too large",
+            status_code=413,
+        )
+
     try:
-        data = await request.json()
-    except Exception as exc:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as exc:
         logger.warning(
             "invalid_json",
-            request_id=getattr(request.state, "request_id", None),
+            request_id=_get_request_id(request),
             error=str(exc),
         )
         return _invalid_request("Request body must be valid JSON")
@@ -135,7 +204,9 @@ async def get_weather_post(request: Request) -> JSONResponse:
     if not data or not isinstance(data, dict):
         return _invalid_request("Request body must be a JSON object")
 
-    return _handle_weather_lookup(request, data.get("city"), data.get("country"))
+    return await run_in_threadpool(
+        _handle_weather_lookup, request, data.get("city"), data.get("country")
+    )
 
 
 @router.options("/v1/weather", status_code=204)
@@ -149,7 +220,7 @@ async def get_weather_by_coordinates(
     request: Request,
     lat: str | None = None,
     lon: str | None = None,
-) -> JSONResponse:
+) -> OrjsonResponse:
     """Get weather data by geographic coordinates."""
     if not lat or not lon:
         return _invalid_request(
@@ -157,28 +228,24 @@ async def get_weather_by_coordinates(
             error="Missing required parameters",
         )
 
-    try:
-        latitude = float(lat)
-        longitude = float(lon)
-
-        if not (-90 <= latitude <= 90):
-            raise ValueError("Latitude must be between -90 and 90")
-        if not (-180 <= longitude <= 180):
-            raise ValueError("Longitude must be between -180 and 180")
-    except ValueError as exc:
+    latitude = _parse_coordinate(lat, 90)
+    longitude = _parse_coordinate(lon, 180)
+    if latitude is None or longitude is None:
         logger.warning(
             "invalid_coordinates",
             request_id=_get_request_id(request),
             lat=lat,
             lon=lon,
-            error=str(exc),
+            error="Latitude must be between -90 and 90 and longitude between -180 and 180",
         )
         return _invalid_request("Invalid coordinate values provided.", error="Invalid coordinates")
 
     try:
-        weather = get_client().get_weather_by_coordinates(latitude, longitude)
+        weather = await run_in_threadpool(
+            get_client().get_weather_by_coordinates, latitude, longitude
+        )
         payload = build_weather_payload(weather)
-        return JSONResponse(content=payload, status_code=200)
+        return OrjsonResponse(content=payload, status_code=200)
     except LocationNotFoundError as exc:
         logger.warning(
             "location_not_found",
@@ -29,6 +29,7 @@ class WeatherResponse(BaseModel):
     condition: str
     humidity: int
     wind_speed: float | int
+    stale: bool | None = None
 
 
 class HealthResponse(BaseModel):
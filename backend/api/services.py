@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 import os
-import re
-import uuid
-from collections import deque
-from datetime import datetime
-from functools import lru_cache
+import secrets
+import string
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
 from typing import Any, cast
 
 import structlog
@@ -16,10 +17,14 @@ from fastapi import Request
 from backend import Location, WeatherClient
 from backend.api.config import (
     CACHE_DURATION_MINUTES,
+    CACHE_DURATION_SECONDS,
     CACHE_SIZE,
     MAX_CITY_LENGTH,
     MAX_COUNTRY_LENGTH,
+    RECENT_SEARCH_SESSIONS,
+    get_log_level,
 )
+from backend.cache import TTLCache
 from backend.exceptions import (
     LocationNotFoundError,
     ParsingError,
@@ -47,13 +52,52 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
-VALID_NAME_PATTERN = re.compile(
-    r"^[a-zA-Z\s\-\.,àáâäãåąčćęèéêëėįìíîïłńòóôöõøùúûüųūÿýżźñçčšžÀÁÂÄÃÅĄĆČĖĘÈÉÊËÌÍÎÏĮŁŃÒÓÔÖÕØÙÚÛÜŲŪŸÝŻŹÑßÇŒÆČŠŽ∂ðА-Яа-яЁё\u4e00-\u9fff\u0600-\u06FF]+$",
-    re.UNICODE,
+
+def configure_logging() -> None:
+    """Send stdlib log records, and so structlog events, to stderr at the configured level."""
+    logging.basicConfig(format="%(message)s", level=get_log_level())
+
+
+# Allowed characters for city/country names, expanded once at import so validation is a
+# per-character set lookup instead of a regex character-class walk.
+VALID_NAME_CHARS = frozenset(
+    string.ascii_letters
+    + "-.,"
+    + "àáâäãåąčćęèéêëėįìíîïłńòóôöõøùúûüųūÿýżźñçčšž"
+    + "ÀÁÂÄÃÅĄĆČĖĘÈÉÊËÌÍÎÏĮŁŃÒÓÔÖÕØÙÚÛÜŲŪŸÝŻŹÑßÇŒÆČŠŽ∂ðЁё"
+).union(
+    # Unicode whitespace (matches regex ``\s``); no whitespace code point lies above U+3000.
+    (chr(code_point) for code_point in range(0x3001) if chr(code_point).isspace()),
+    (chr(code_point) for code_point in range(0x0410, 0x0450)),  # Cyrillic А-Я, а-я
+    (chr(code_point) for code_point in range(0x4E00, 0xA000)),  # CJK unified ideographs
+    (chr(code_point) for code_point in range(0x0600, 0x0700)),  # Arabic
 )
+# Compact subset used for pure-ASCII input, which is the common case ("Seattle", "USA").
+ASCII_NAME_CHARS = frozenset(char for char in VALID_NAME_CHARS if char.isascii())
+# The same subset as bytes: deleting these from encoded ASCII input leaves only invalid ones.
+_ASCII_NAME_BYTES = bytes(sorted(map(ord, ASCII_NAME_CHARS)))
+
 
-recent_searches: dict[str, deque[dict[str, str]]] = {}
+weather_cache: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+    maxsize=CACHE_SIZE, ttl=CACHE_DURATION_SECONDS
+)
+# Last successful payload per location, served (marked stale) when the upstream fetch fails.
+stale_weather_cache: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+    maxsize=CACHE_SIZE, ttl=float("inf")
+)
+# Upstream fetches currently in progress, so concurrent misses for one key share a single call.
+_inflight_fetches: dict[tuple[str, str], Future[tuple[dict[str, Any], int]]] = {}
+_inflight_lock = Lock()
+MAX_RECENT_SEARCHES = 10
+SESSION_COOKIE_NAME = "sid"
+SESSION_ID_LENGTH = 32
+
+# Recent searches per session, in least-recently-used order so idle sessions can be evicted.
+# Each session maps (city, country) -> None, oldest search first, for O(1) de-duplication.
+recent_searches: OrderedDict[str, OrderedDict[tuple[str, str], None]] = OrderedDict()
+_recent_searches_lock = Lock()
 _weather_client: WeatherClient | None = None
+_client_lock = Lock()
 
 
 def validate_input(
@@ -70,7 +114,15 @@ def validate_input(
     if len(value) > max_length:
         return None, f"{field_name} exceeds maximum length of {max_length} characters"
 
-    if not VALID_NAME_PATTERN.match(value):
+    if value.isascii():
+        # Single-word names ("Seattle", "USA") are all letters and need no further scan;
+        # otherwise bytes.translate strips the allowed bytes in one C pass over the input.
+        has_invalid = not value.isalpha() and bool(
+            value.encode("ascii").translate(None, _ASCII_NAME_BYTES)
+        )
+    else:
+        has_invalid = not VALID_NAME_CHARS.issuperset(value)
+    if has_invalid:
         return None, f"{field_name} contains invalid characters"
 
     return value, None
@@ -80,32 +132,77 @@ def get_client() -> WeatherClient:
     """Get or create the shared weather client instance."""
     global _weather_client
 
-    if _weather_client is None:
-        timeout = int(os.getenv("REQUEST_TIMEOUT", "15"))
-        _weather_client = WeatherClient(timeout=timeout)
+    client = _weather_client
+    if client is None:
+        with _client_lock:
+            if _weather_client is None:
+                timeout = int(os.getenv("REQUEST_TIMEOUT", "15"))
+                # Weather is cached here (with stale fallback), so the client cache is disabled.
+                # Upstream failures fall back to stale data, so don't hold the worker retrying.
+                _weather_client = WeatherClient(timeout=timeout, cache_ttl=0, retries=0)
+            client = _weather_client
 
-    return _weather_client
+    return client
 
 
 def close_client() -> None:
     """Close the shared weather client if it exists."""
     global _weather_client
 
-    if _weather_client is not None:
-        _weather_client.close()
-        _weather_client = None
+    with _client_lock:
+        if _weather_client is not None:
+            _weather_client.close()
+            _weather_client = None
 
 
 def build_weather_payload(weather: WeatherData) -> dict[str, Any]:
     """Serialize the weather model into an API response payload."""
-    return weather.model_dump()
+    return weather.model_dump(exclude={"hourly"})
+
+
+def get_cached_weather(city: str, country: str) -> tuple[dict[str, Any], int]:
+    """Get weather, serving successful lookups from the TTL cache.
+
+    On a cache miss only one caller per location fetches from upstream; concurrent callers
+    for the same location wait for and share that result. If the fetch fails with a server
+    error, the last good payload for the location is returned with ``"stale": True``.
+    """
+    key = (city, country)
+    cached_payload = weather_cache.get(key)
+    if cached_payload is not None:
+        return cached_payload, 200
 
+    with _inflight_lock:
+        pending = _inflight_fetches.get(key)
+        if pending is None:
+            future: Future[tuple[dict[str, Any], int]] = Future()
+            _inflight_fetches[key] = future
 
-@lru_cache(maxsize=CACHE_SIZE)
-def get_cached_weather(city: str, country: str, minute_bucket: int) -> tuple[dict[str, Any], int]:
-    """Get weather with time-bucketed caching."""
-    del minute_bucket  # Used only as cache key entropy.
+    if pending is not None:
+        return pending.result()
 
+    try:
+        payload, status_code = fetch_weather(city, country)
+        if status_code == 200:
+            weather_cache.set(key, payload)
+            stale_weather_cache.set(key, payload)
+        elif status_code >= 500:
+            stale_payload = stale_weather_cache.get(key)
+            if stale_payload is not None:
+                logger.warning("serving_stale_weather", city=city, country=country)
+                payload, status_code = {**stale_payload, "stale": True}, 200
+        future.set_result((payload, status_code))
+        return payload, status_code
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight_fetches[key]
+
+
+def fetch_weather(city: str, country: str) -> tuple[dict[str, Any], int]:
+    """Fetch weather from the upstream service and map errors to API responses."""
     try:
         location = Location(city=city, country=country, latitude=None, longitude=None)
         weather = get_client().get_weather(location)
@@ -136,58 +233,94 @@ def get_cached_weather(city: str, country: str, minute_bucket: int) -> tuple[dic
         return {"error": "Internal server error", "message": "An unexpected error occurred."}, 500
 
 
-def get_minute_bucket(now: datetime | None = None) -> int:
-    """Return the active cache bucket."""
-    current_time = now or datetime.now()
-    return current_time.minute // CACHE_DURATION_MINUTES if CACHE_DURATION_MINUTES > 0 else 0
+def lookup_weather(city: str, country: str) -> tuple[dict[str, Any], int]:
+    """Get weather through the cache using a case-insensitive key.
+
+    MSN location search is case-insensitive, so "Seattle" and "SEATTLE" share one cache
+    entry. The response location keeps the caller's spelling.
+    """
+    payload, status_code = get_cached_weather(city.casefold(), country.casefold())
+    if status_code != 200:
+        return payload, status_code
+
+    location = {**payload["location"], "city": city, "country": country}
+    return {**payload, "location": location}, status_code
+
+
+def get_session_id(request: Request) -> str | None:
+    """Return the recent-searches session id from the ``sid`` cookie, if well-formed."""
+    session_id = request.cookies.get(SESSION_COOKIE_NAME)
+    if session_id and len(session_id) == SESSION_ID_LENGTH:
+        return session_id
+    return cast(str | None, getattr(request.state, "session_id", None))
 
 
 def add_to_recent_searches(request: Request, city: str, country: str) -> None:
     """Store a location in the current session's recent-searches list."""
-    session_id = cast(str | None, request.session.get("id"))
+    session_id = get_session_id(request)
     if not session_id:
-        session_id = str(uuid.uuid4())
-        request.session["id"] = session_id
+        session_id = secrets.token_hex(16)
+        request.state.session_id = session_id
 
-    if session_id not in recent_searches:
-        recent_searches[session_id] = deque(maxlen=10)
+    search_key = (city, country)
+    with _recent_searches_lock:
+        searches = recent_searches.get(session_id)
+        if searches is None:
+            searches = recent_searches[session_id] = OrderedDict()
+            while len(recent_searches) > RECENT_SEARCH_SESSIONS:
+                recent_searches.popitem(last=False)
+        else:
+            recent_searches.move_to_end(session_id)
 
-    search_entry = {"city": city, "country": country}
-    searches = recent_searches[session_id]
-    if search_entry in searches:
-        searches.remove(search_entry)
-    searches.appendleft(search_entry)
+        searches.pop(search_key, None)
+        searches[search_key] = None
+        if len(searches) > MAX_RECENT_SEARCHES:
+            searches.popitem(last=False)
 
 
 def get_recent_search_history(request: Request) -> list[dict[str, str]]:
     """Return the current session's recent searches."""
-    session_id = cast(str | None, request.session.get("id"))
-    if not session_id or session_id not in recent_searches:
+    session_id = get_session_id(request)
+    if not session_id:
         return []
-    return list(recent_searches[session_id])
+
+    with _recent_searches_lock:
+        searches = recent_searches.get(session_id)
+        if searches is None:
+            return []
+        return [{"city": city, "country": country} for city, country in reversed(searches)]
 
 
 def clear_recent_search_history(request: Request) -> None:
     """Delete the current session's recent-searches list."""
-    session_id = cast(str | None, request.session.get("id"))
-    if session_id and session_id in recent_searches:
-        del recent_searches[session_id]
+    session_id = get_session_id(request)
+    if session_id:
+        with _recent_searches_lock:
+            recent_searches.pop(session_id, None)
 
 
 __all__ = [
     "CACHE_DURATION_MINUTES",
+    "CACHE_DURATION_SECONDS",
     "CACHE_SIZE",
     "MAX_CITY_LENGTH",
     "MAX_COUNTRY_LENGTH",
+    "MAX_RECENT_SEARCHES",
+    "SESSION_COOKIE_NAME",
     "add_to_recent_searches",
     "build_weather_payload",
     "clear_recent_search_history",
     "close_client",
+    "configure_logging",
+    "fetch_weather",
     "get_cached_weather",
     "get_client",
-    "get_minute_bucket",
     "get_recent_search_history",
+    "get_session_id",
     "logger",
+    "lookup_weather",
     "recent_searches",
+    "stale_weather_cache",
     "validate_input",
+    "weather_cache",
 ]
@@ -15,10 +15,10 @@ a test client instance::
 
 from __future__ import annotations
 
-import json
 from typing import Any, cast
 
 import httpx
+import orjson
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -29,10 +29,10 @@ class _SyntheticResponse:
     def __init__(self, status_code: int, payload: dict[str, str]) -> None:
         self.status_code = status_code
         self.headers: dict[str, str] = {}
-        self.content = json.dumps(payload).encode("utf-8")
+        self.content = orjson.dumps(payload)
 
     def json(self) -> dict[str, str]:
-        return cast(dict[str, str], json.loads(self.content.decode("utf-8")))
+        return cast(dict[str, str], orjson.loads(self.content))
 
 
 class _TestClientResponse:
@@ -1,42 +1,301 @@
 """Weather client for interacting with MSN Weather services."""
 
 import asyncio
-import json
+import functools
 import re
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
 from urllib.parse import quote
 
 import httpx  # type: ignore[import-not-found]
+import lxml.html  # type: ignore[import-untyped]
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from geopy.geocoders import Nominatim  # type: ignore[import-not-found, import-untyped]
+from requests.adapters import HTTPAdapter
 from tenacity import (  # type: ignore[import-not-found]
+    RetryCallState,
     retry,
-    retry_if_exception_type,
-    stop_after_attempt,
+    retry_if_exception,
     wait_exponential,
 )
 
+from backend.cache import TTLCache
 from backend.exceptions import (
     LocationNotFoundError,
     ParsingError,
     UpstreamError,
     WeatherError,
 )
-from backend.models import Location, WeatherData
+from backend.models import HourlyForecast, Location, WeatherData
+
+# Upper bound on pooled upstream connections per client, sized for concurrent lookups
+_MAX_CONNECTIONS = 100
+
+GEOCODER_USER_AGENT = "msn-weather-wrapper"
+_BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+NOMINATIM_REVERSE_URL = "https://nominatim.openstreetmap.org/reverse"
+
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_PAGE_TEXT_XPATH = lxml.etree.XPath("//text()[not(parent::script or parent::style)]")
+# Plain strings: orjson rejects lxml's str subclasses
+_JSON_SCRIPTS_XPATH = lxml.etree.XPath(
+    '//script[@type="application/json"]/text()', smart_strings=False
+)
+_PERCENT_TEXT_XPATH = lxml.etree.XPath('//text()[contains(., "%")]')
+
+# Fallback selectors in priority order. They stay separate rather than one union
+# expression, because a union yields matches in document order and loses the priority.
+_TEMPERATURE_XPATHS = tuple(
+    lxml.etree.XPath(expression)
+    for expression in (
+        '//span[contains(@class, "temp")]',
+        '//div[contains(@class, "temp")]',
+        '//*[contains(@data-testid, "temperature")]',
+        '//span[contains(@class, "CurrentConditions")]',
+    )
+)
+_CONDITION_XPATHS = tuple(
+    lxml.etree.XPath(expression)
+    for expression in (
+        '//*[contains(@class, "condition")]',
+        '//*[contains(@class, "weather")]',
+        '//*[contains(@data-testid, "condition")]',
+        '//div[contains(@class, "caption")]',
+    )
+)
+
+_NUMBER_RE = re.compile(r"(-?\d+\.?\d*)")
+_INTEGER_RE = re.compile(r"(\d+)")
+_PERCENT_RE = re.compile(r"(\d+)%")
+_HUMIDITY_RE = re.compile(r"humidity[:\s]*(\d+)%|(\d+)%\s*humidity", re.IGNORECASE)
+_WIND_RE = re.compile(
+    r"wind[:\s]*(\d+\.?\d*)\s*(mph|km/h|m/s)|(\d+\.?\d*)\s*(mph|km/h|m/s)\s*wind",
+    re.IGNORECASE,
+)
+_CURRENT_TEMP_PATTERNS = (
+    re.compile(r"Current weather.*?(-?\d+\.?\d*)\s*°\s*([CF])", re.IGNORECASE),
+    re.compile(r"Current weather.*?(-?\d+\.?\d*)\s*°", re.IGNORECASE),
+)
+
+# Raw-HTML fallbacks for pages whose WeatherData JSON could not be decoded
+_RAW_TEMP_RE = re.compile(r'"(?:currentTemperature|temperature|temp)"\s*:\s*"?(-?\d+\.?\d*)')
+_RAW_CONDITION_RE = re.compile(r'"(?:shortCap|cap|summary|pvdrCap)"\s*:\s*"([^\"]+)"')
+_RAW_HUMIDITY_RE = re.compile(r'"(?:humidity|rh)"\s*:\s*"?(\d+)')
+_RAW_WIND_RE = re.compile(r'"(?:windSpeedNumber|windSpd|windSpeed)"\s*:\s*"?(-?\d+\.?\d*)')
+_RAW_FAHRENHEIT_RE = re.compile(r'"degreeSetting"\s*:\s*"°?F"', re.IGNORECASE)
+_RAW_MPH_RE = re.compile(r"mph", re.IGNORECASE)
+
+# Condition fallback terms in priority order. "Partly Cloudy" is not listed because it
+# contains "Cloudy", which always matched first.
+_WEATHER_TERMS = ("Sunny", "Cloudy", "Rainy", "Clear", "Overcast", "Thunderstorm")
+
+_KMH_PER_UNIT = {"mph": 1.60934, "m/s": 3.6}
+
+
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse an HTML document into an lxml tree.
+
+    Args:
+        html: The raw HTML content
+
+    Returns:
+        The root element of the document; an empty ``<html>`` element if there is no markup
+    """
+    try:
+        return lxml.html.document_fromstring(html.encode("utf-8", "replace"), parser=_HTML_PARSER)
+    except lxml.etree.ParserError:
+        return lxml.html.Element("html")
+
+
+def _find_state_script(html: str) -> str | None:
+    """Return the body of the JSON script element that embeds ``WeatherData``, if any.
+
+    Args:
+        html: The raw HTML content
+
+    Returns:
+        The script's JSON text, or None if the marker is not inside an application/json script
+    """
+    marker = html.find('"WeatherData"')
+    if marker == -1:
+        return None
+
+    start = html.rfind("<script", 0, marker)
+    if start == -1:
+        return None
+    open_end = html.find(">", start, marker)
+    if open_end == -1 or "application/json" not in html[start:open_end]:
+        return None
+    if html.find("</script>", open_end, marker) != -1:
+        return None
+
+    end = html.find("</script>", marker)
+    if end == -1:
+        return None
+    return html[open_end + 1 : end]
+
+
+def _json_number(value: object) -> float | None:
+    """Return a decoded JSON number as a float, or None for strings and other values."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _to_celsius(temperature: float, fahrenheit: bool) -> float:
+    """Return a temperature in Celsius, rounded to one decimal place."""
+    if fahrenheit:
+        temperature = (temperature - 32) * 5 / 9
+    return round(temperature, 1)
+
+
+def _to_kmh(speed: float, unit: str) -> float:
+    """Return a wind speed given in ``unit`` (mph, m/s or km/h) in km/h, rounded to one place."""
+    return round(speed * _KMH_PER_UNIT.get(unit, 1.0), 1)
+
+
+def _clamp_humidity(humidity: int) -> int:
+    """Return a humidity percentage clamped to the model's 0-100 range."""
+    return max(0, min(100, humidity))
+
+
+def _clamp_wind_speed(wind_speed: float) -> float:
+    """Return a wind speed clamped to the model's non-negative range."""
+    return max(0.0, wind_speed)
+
+
+def _element_text(element: lxml.html.HtmlElement) -> str:
+    """Return the stripped text content of an element and its descendants."""
+    return "".join(element.itertext()).strip()
+
+
+def _page_text(tree: lxml.html.HtmlElement) -> str:
+    """Return the visible text of a document, skipping script and style contents."""
+    return "".join(_PAGE_TEXT_XPATH(tree))
+
+
+def _spaced_page_text(tree: lxml.html.HtmlElement) -> str:
+    """Return the visible text with one space between text nodes, so numbers stay apart."""
+    return " ".join(" ".join(_PAGE_TEXT_XPATH(tree)).split())
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Return whether an upstream request error is worth retrying (network or 5xx)."""
+    if isinstance(error, requests.HTTPError | httpx.HTTPStatusError):
+        return error.response is None or error.response.status_code >= 500
+    return isinstance(error, requests.RequestException | httpx.TransportError)
+
+
+_retry_backoff = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _retries_exhausted(retry_state: RetryCallState) -> bool:
+    """Return whether the calling client has used up its configured retries."""
+    client: BaseWeatherClient = retry_state.args[0]
+    return bool(retry_state.attempt_number > client.retries)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Return the client's fixed retry wait, or exponential backoff when it has none."""
+    client: BaseWeatherClient = retry_state.args[0]
+    if client.retry_wait is not None:
+        return client.retry_wait
+    return float(_retry_backoff(retry_state))
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_location_url(base_url: str, city: str, country: str) -> str:
+    """Return the URL-encoded MSN Weather forecast URL for a city and country."""
+    return f"{base_url}{quote(f'{city},{country}')}"
+
+
+# Clients are often short-lived, so connections and geocoder state are shared process-wide
+_shared_lock = Lock()
+_shared_session: requests.Session | None = None
+_shared_geocoder: Nominatim | None = None
+
+
+def _get_shared_session() -> requests.Session:
+    """Return the process-wide requests session used by every WeatherClient."""
+    global _shared_session
+
+    with _shared_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            # requests has no HTTP/2; keep enough pooled connections for threaded callers instead
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=_MAX_CONNECTIONS),
+            )
+            session.headers.update({"User-Agent": _BROWSER_USER_AGENT})
+            _shared_session = session
+        return _shared_session
+
+
+def _get_shared_geocoder() -> Nominatim:
+    """Return the process-wide Nominatim geocoder used by every client."""
+    global _shared_geocoder
+
+    with _shared_lock:
+        if _shared_geocoder is None:
+            _shared_geocoder = Nominatim(user_agent=GEOCODER_USER_AGENT)
+        return _shared_geocoder
 
 
 class BaseWeatherClient:
     """Base class for weather clients with shared extraction logic."""
 
-    def __init__(self, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache_ttl: float = 300,
+        cache_size: int = 256,
+        retries: int = 2,
+        retry_wait: float | None = None,
+    ) -> None:
         """Initialize the base weather client.
 
         Args:
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to reuse weather for a location; 0 disables caching
+            cache_size: Maximum number of locations kept in the weather cache
+            retries: Extra attempts after a transient network or 5xx failure
+            retry_wait: Fixed seconds between attempts; None backs off exponentially (2-10s)
         """
         self.timeout = timeout
         self.base_url = "https://www.msn.com/en-us/weather/forecast/in-"
-        self.geocoder = Nominatim(user_agent="msn-weather-wrapper")
+        self.geocoder = _get_shared_geocoder()
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.retries = retries
+        self.retry_wait = retry_wait
+        self._cache: TTLCache[tuple[str, str], WeatherData] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl
+        )
+
+    def _get_cached_weather(self, location: Location) -> WeatherData | None:
+        """Return unexpired cached weather for a location, reported against that location.
+
+        Args:
+            location: Location to look up
+
+        Returns:
+            A copy of the cached weather with ``location`` substituted, or None on a miss
+        """
+        weather = self._cache.get((location.city, location.country))
+        if weather is None:
+            return None
+        return weather.model_copy(update={"location": location})
+
+    def _cache_weather(self, weather: WeatherData) -> None:
+        """Store weather for its location, evicting the least recently used entry if full.
+
+        Args:
+            weather: Freshly fetched weather data
+        """
+        self._cache.set((weather.location.city, weather.location.country), weather)
 
     def _get_location_url(self, location: Location) -> str:
         """Construct the MSN Weather URL for the given location.
@@ -47,9 +306,7 @@ class BaseWeatherClient:
         Returns:
             str: The MSN Weather forecast URL for the specified location.
         """
-        location_str = f"{location.city},{location.country}"
-        encoded_location = quote(location_str)
-        return f"{self.base_url}{encoded_location}"
+        return _build_location_url(self.base_url, location.city, location.country)
 
     def _parse_weather_response(self, html: str, location: Location) -> WeatherData:
         """Parse weather data from an HTML response.
@@ -67,27 +324,38 @@ class BaseWeatherClient:
                 content, for example when required values are missing or have
                 an unexpected format.
         """
+        # Parse at most once: the JSON script scan and the selector fallback share one tree
+        tree: lxml.html.HtmlElement | None = None
+
+        def parsed_tree() -> lxml.html.HtmlElement:
+            nonlocal tree
+            if tree is None:
+                tree = _parse_html(html)
+            return tree
+
         # Try to extract weather data from embedded JSON
-        weather_data = self._extract_weather_from_json(html)
+        weather_data = self._extract_weather_from_json(html, parsed_tree)
         if weather_data:
-            return WeatherData(
-                location=location,
+            return self._build_weather_data(
+                location,
                 temperature=float(weather_data["temperature"]),
                 condition=str(weather_data["condition"]),
                 humidity=int(weather_data["humidity"]),
                 wind_speed=float(weather_data["wind_speed"]),
+                hourly=[self._build_hourly(hour) for hour in weather_data.get("hourly", ())],
             )
 
         # Fallback to HTML parsing if JSON extraction fails
-        soup = BeautifulSoup(html, "lxml")
+        document = parsed_tree()
+        page_text = _page_text(document)
         try:
-            temperature = self._extract_temperature(soup)
-            condition = self._extract_condition(soup)
-            humidity = self._extract_humidity(soup)
-            wind_speed = self._extract_wind_speed(soup)
+            temperature = self._extract_temperature(document)
+            condition = self._extract_condition(document, page_text)
+            humidity = self._extract_humidity(document, page_text)
+            wind_speed = self._extract_wind_speed(document, page_text)
 
-            return WeatherData(
-                location=location,
+            return self._build_weather_data(
+                location,
                 temperature=temperature,
                 condition=condition,
                 humidity=humidity,
@@ -96,157 +364,104 @@ class BaseWeatherClient:
         except ValueError as e:
             raise ParsingError(f"Failed to parse weather data: {str(e)}") from e
 
-    def _extract_weather_from_json(self, html: str) -> dict[str, float | int | str] | None:
+    def _build_weather_data(
+        self,
+        location: Location,
+        *,
+        temperature: float,
+        condition: str,
+        humidity: int,
+        wind_speed: float,
+        hourly: list[HourlyForecast] | None = None,
+    ) -> WeatherData:
+        """Build WeatherData from already-converted values without re-running validation.
+
+        Args:
+            location: The location the weather applies to
+            temperature: Temperature in Celsius
+            condition: Weather condition description
+            humidity: Humidity percentage
+            wind_speed: Wind speed in km/h
+            hourly: Hourly forecast entries from ``_build_hourly``, if the page provided them
+
+        Returns:
+            WeatherData with humidity and wind speed clamped to the model's bounds
+        """
+        return WeatherData.model_construct(
+            location=location,
+            temperature=temperature,
+            condition=condition,
+            humidity=_clamp_humidity(humidity),
+            wind_speed=_clamp_wind_speed(wind_speed),
+            hourly=hourly or [],
+        )
+
+    def _build_hourly(self, hour: dict[str, Any]) -> HourlyForecast:
+        """Build one HourlyForecast from converted values without re-running validation.
+
+        Args:
+            hour: Dictionary with temperature, condition, humidity, and wind_speed
+
+        Returns:
+            HourlyForecast with humidity and wind speed clamped to the model's bounds
+        """
+        return HourlyForecast.model_construct(
+            temperature=float(hour["temperature"]),
+            condition=str(hour["condition"]),
+            humidity=_clamp_humidity(int(hour["humidity"])),
+            wind_speed=_clamp_wind_speed(float(hour["wind_speed"])),
+        )
+
+    def _extract_weather_from_json(
+        self, html: str, parse_tree: Callable[[], lxml.html.HtmlElement] | None = None
+    ) -> dict[str, Any] | None:
         """Extract weather data from embedded JSON in the HTML.
 
         Args:
             html: The HTML content
+            parse_tree: Returns the parsed document when the script scan needs it, so the
+                caller can reuse the same tree; defaults to parsing ``html`` here
 
         Returns:
-            Dictionary with temperature, condition, humidity, and wind_speed, or None if not found
+            Dictionary with temperature, condition, humidity, and wind_speed (plus ``hourly``
+            when the state JSON was decoded), or None if not found
         """
+        if '"WeatherData"' not in html:
+            return None
+
         try:
-            # Parse script tags with type="application/json"
-            soup = BeautifulSoup(html, "lxml")
+            # MSN embeds one state blob; slice it out of the raw HTML before building a DOM
+            state_script = _find_state_script(html)
+            if state_script is not None:
+                weather = self._extract_weather_from_script(state_script)
+                if weather:
+                    return weather
 
-            for script in soup.find_all("script", type="application/json"):
-                try:
-                    data = json.loads(script.string)
-
-                    # Navigate to WeatherData._@STATE@_.forecast[0].hourly
-                    if "WeatherData" not in data:
-                        continue
-
-                    weather_data = data["WeatherData"]
-                    if not isinstance(weather_data, dict) or "_@STATE@_" not in weather_data:
-                        continue
-
-                    state = weather_data["_@STATE@_"]
-                    if not isinstance(state, dict):
-                        continue
-
-                    current: dict[str, object] | None = None
-
-                    current_condition = state.get("currentCondition")
-                    if isinstance(current_condition, dict):
-                        current = current_condition
-                    else:
-                        forecast = state.get("forecast")
-                        if isinstance(forecast, list) and forecast:
-                            first_forecast = forecast[0]
-                            if isinstance(first_forecast, dict):
-                                hourly = first_forecast.get("hourly")
-                                if isinstance(hourly, list) and hourly:
-                                    first_hourly = hourly[0]
-                                    if isinstance(first_hourly, dict):
-                                        current = first_hourly
-
-                    if not current:
-                        continue
-
-                    current_raw = current.get("currentRaw")
-                    current_raw_data = current_raw if isinstance(current_raw, dict) else {}
-
-                    temp_value = current.get(
-                        "currentTemperature",
-                        current.get(
-                            "temperature",
-                            current.get("temp", current_raw_data.get("temp", 0)),
-                        ),
-                    )
-                    try:
-                        temperature = float(str(temp_value).replace("°", "").strip())
-                    except (TypeError, ValueError):
-                        temperature = 0.0
-
-                    degree_setting = str(
-                        current.get("degreeSetting", state.get("unit", "F"))
-                    ).upper()
-                    if "F" in degree_setting:
-                        temperature = round((temperature - 32) * 5 / 9, 1)
-                    else:
-                        temperature = round(temperature, 1)
-
-                    condition = (
-                        current.get("shortCap")
-                        or current.get("cap")
-                        or current.get("summary")
-                        or current_raw_data.get("cap")
-                        or current_raw_data.get("pvdrCap")
-                    )
-                    if not condition:
-                        rich_caps = current.get("richCaps")
-                        if isinstance(rich_caps, list) and rich_caps:
-                            condition = rich_caps[0]
-                    condition_text = str(condition or "Unknown")
-
-                    humidity_raw = str(current.get("humidity", current_raw_data.get("rh", "50")))
-                    humidity_match = re.search(r"(\d+)", humidity_raw)
-                    humidity = int(humidity_match.group(1)) if humidity_match else 50
-
-                    wind_raw = str(
-                        current.get(
-                            "windSpeedNumber",
-                            current.get("windSpeed", current_raw_data.get("windSpd", "0")),
-                        )
-                    )
-                    wind_match = re.search(r"(-?\d+\.?\d*)", wind_raw)
-                    wind_value = float(wind_match.group(1)) if wind_match else 0.0
-                    wind_units = str(
-                        current.get(
-                            "windSpeedUnit",
-                            current.get("unitsRaw", current.get("windSpeed", "")),
-                        )
-                    ).lower()
-                    wind_speed = (
-                        round(wind_value * 1.60934, 1)
-                        if "mph" in wind_units
-                        else round(wind_value, 1)
-                    )
-
-                    return {
-                        "temperature": temperature,
-                        "condition": condition_text,
-                        "humidity": humidity,
-                        "wind_speed": wind_speed,
-                    }
-
-                except (json.JSONDecodeError, KeyError, ValueError, AttributeError, TypeError):
-                    continue
+            tree = parse_tree() if parse_tree is not None else _parse_html(html)
 
-            if '"WeatherData"' not in html:
-                return None
+            # Parse script tags with type="application/json"
+            for raw in _JSON_SCRIPTS_XPATH(tree):
+                # Pages carry several large JSON blobs; only decode the one holding the state
+                if '"WeatherData"' not in raw:
+                    continue
+                weather = self._extract_weather_from_script(raw)
+                if weather:
+                    return weather
 
-            temp_match = re.search(
-                r'"(?:currentTemperature|temperature|temp)"\s*:\s*"?(-?\d+\.?\d*)',
-                html,
-            )
-            condition_match = re.search(
-                r'"(?:shortCap|cap|summary|pvdrCap)"\s*:\s*"([^\"]+)"',
-                html,
-            )
-            humidity_match = re.search(r'"(?:humidity|rh)"\s*:\s*"?(\d+)', html)
-            wind_match = re.search(
-                r'"(?:windSpeedNumber|windSpd|windSpeed)"\s*:\s*"?(-?\d+\.?\d*)',
-                html,
-            )
+            temp_match = _RAW_TEMP_RE.search(html)
+            condition_match = _RAW_CONDITION_RE.search(html)
+            humidity_match = _RAW_HUMIDITY_RE.search(html)
+            wind_match = _RAW_WIND_RE.search(html)
 
             if not any((temp_match, condition_match, humidity_match, wind_match)):
                 return None
 
             temperature = float(temp_match.group(1)) if temp_match else 0.0
-            if re.search(r'"degreeSetting"\s*:\s*"°?F"', html, re.IGNORECASE):
-                temperature = round((temperature - 32) * 5 / 9, 1)
-            else:
-                temperature = round(temperature, 1)
+            temperature = _to_celsius(temperature, bool(_RAW_FAHRENHEIT_RE.search(html)))
 
             humidity = int(humidity_match.group(1)) if humidity_match else 50
             wind_value = float(wind_match.group(1)) if wind_match else 0.0
-            wind_speed = (
-                round(wind_value * 1.60934, 1)
-                if re.search(r"mph", html, re.IGNORECASE)
-                else round(wind_value, 1)
-            )
+            wind_speed = _to_kmh(wind_value, "mph" if _RAW_MPH_RE.search(html) else "km/h")
 
             return {
                 "temperature": temperature,
@@ -258,126 +473,227 @@ class BaseWeatherClient:
         except Exception:
             return None
 
-    def _extract_temperature(self, soup: BeautifulSoup) -> float:
+    def _extract_weather_from_script(self, raw: str) -> dict[str, Any] | None:
+        """Decode a JSON script body and extract current conditions from it.
+
+        Args:
+            raw: The text content of an application/json script element
+
+        Returns:
+            Dictionary as returned by ``_extract_weather_from_state``, or None if absent
+        """
+        try:
+            return self._extract_weather_from_state(orjson.loads(raw))
+        except (orjson.JSONDecodeError, KeyError, ValueError, AttributeError, TypeError):
+            return None
+
+    def _extract_weather_from_state(self, data: object) -> dict[str, Any] | None:
+        """Extract current conditions and the hourly forecast from a decoded state blob.
+
+        Args:
+            data: The decoded JSON document from a page script
+
+        Returns:
+            Dictionary with temperature, condition, humidity, wind_speed, and an ``hourly``
+            list of dictionaries with the same fields, or None if absent
+        """
+        # Navigate to WeatherData._@STATE@_.forecast[0].hourly
+        if not isinstance(data, dict) or "WeatherData" not in data:
+            return None
+
+        weather_data = data["WeatherData"]
+        if not isinstance(weather_data, dict) or "_@STATE@_" not in weather_data:
+            return None
+
+        state = weather_data["_@STATE@_"]
+        if not isinstance(state, dict):
+            return None
+
+        hourly: list[dict[str, object]] = []
+        forecast = state.get("forecast")
+        if isinstance(forecast, list) and forecast:
+            first_forecast = forecast[0]
+            if isinstance(first_forecast, dict):
+                hourly_entries = first_forecast.get("hourly")
+                if isinstance(hourly_entries, list):
+                    hourly = [entry for entry in hourly_entries if isinstance(entry, dict)]
+
+        current: dict[str, object] | None = None
+
+        current_condition = state.get("currentCondition")
+        if isinstance(current_condition, dict):
+            current = current_condition
+        elif hourly:
+            current = hourly[0]
+
+        if not current:
+            return None
+
+        # Every hour goes through the same conversions as the current conditions
+        return {
+            **self._conditions_from_entry(current, state),
+            "hourly": [self._conditions_from_entry(entry, state) for entry in hourly],
+        }
+
+    def _conditions_from_entry(
+        self, current: dict[str, object], state: dict[str, object]
+    ) -> dict[str, float | int | str]:
+        """Convert one current-conditions or hourly entry to metric weather values.
+
+        Args:
+            current: The ``currentCondition`` or hourly forecast entry
+            state: The enclosing ``_@STATE@_`` object, used for the default unit
+
+        Returns:
+            Dictionary with temperature, condition, humidity, and wind_speed
+        """
+        current_raw = current.get("currentRaw")
+        current_raw_data = current_raw if isinstance(current_raw, dict) else {}
+
+        temp_value = current.get(
+            "currentTemperature",
+            current.get(
+                "temperature",
+                current.get("temp", current_raw_data.get("temp", 0)),
+            ),
+        )
+        temperature = _json_number(temp_value)
+        if temperature is None:
+            try:
+                temperature = float(str(temp_value).replace("°", "").strip())
+            except (TypeError, ValueError):
+                temperature = 0.0
+
+        degree_setting = str(current.get("degreeSetting", state.get("unit", "F"))).upper()
+        temperature = _to_celsius(temperature, "F" in degree_setting)
+
+        condition = (
+            current.get("shortCap")
+            or current.get("cap")
+            or current.get("summary")
+            or current_raw_data.get("cap")
+            or current_raw_data.get("pvdrCap")
+        )
+        if not condition:
+            rich_caps = current.get("richCaps")
+            if isinstance(rich_caps, list) and rich_caps:
+                condition = rich_caps[0]
+        condition_text = str(condition or "Unknown")
+
+        humidity_raw = current.get("humidity", current_raw_data.get("rh", 50))
+        humidity_number = _json_number(humidity_raw)
+        if humidity_number is not None:
+            humidity = int(humidity_number)
+        else:
+            humidity_match = _INTEGER_RE.search(str(humidity_raw))
+            humidity = int(humidity_match.group(1)) if humidity_match else 50
+
+        wind_raw = current.get(
+            "windSpeedNumber",
+            current.get("windSpeed", current_raw_data.get("windSpd", 0)),
+        )
+        wind_value = _json_number(wind_raw)
+        if wind_value is None:
+            wind_match = _NUMBER_RE.search(str(wind_raw))
+            wind_value = float(wind_match.group(1)) if wind_match else 0.0
+        wind_units = str(
+            current.get(
+                "windSpeedUnit",
+                current.get("unitsRaw", current.get("windSpeed", "")),
+            )
+        ).lower()
+        wind_speed = _to_kmh(wind_value, "mph" if "mph" in wind_units else "km/h")
+
+        return {
+            "temperature": temperature,
+            "condition": condition_text,
+            "humidity": humidity,
+            "wind_speed": wind_speed,
+        }
+
+    def _extract_temperature(self, tree: lxml.html.HtmlElement) -> float:
         """Extract temperature from the page."""
         # Try to find temperature in common locations
-        temp_selectors = [
-            'span[class*="temp"]',
-            'div[class*="temp"]',
-            '[data-testid*="temperature"]',
-            'span[class*="CurrentConditions"]',
-        ]
-
-        for selector in temp_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
+        for selector in _TEMPERATURE_XPATHS:
+            for element in selector(tree):
+                text = _element_text(element)
                 # Look for temperature patterns like "72°", "72", "72°F", "22°C"
-                match = re.search(r"(-?\d+\.?\d*)", text)
+                match = _NUMBER_RE.search(text)
                 if match:
-                    temp = float(match.group(1))
                     # Convert Fahrenheit to Celsius if needed
-                    if "°F" in text or "F" in text:
-                        temp = (temp - 32) * 5 / 9
-                    return round(temp, 1)
-
-        page_text = " ".join(soup.get_text(" ", strip=True).split())
-        text_patterns = [
-            r"Current weather.*?(-?\d+\.?\d*)\s*°\s*([CF])",
-            r"Current weather.*?(-?\d+\.?\d*)\s*°",
-        ]
-
-        for pattern in text_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+                    return _to_celsius(float(match.group(1)), "F" in text)
+
+        # Adjacent text nodes must not run together ("10" + "72°F" is not "1072°F")
+        page_text = _spaced_page_text(tree)
+        for pattern in _CURRENT_TEMP_PATTERNS:
+            match = pattern.search(page_text)
             if not match:
                 continue
 
-            temp = float(match.group(1))
             unit = match.group(2).upper() if match.lastindex and match.lastindex > 1 else ""
-            if unit == "F":
-                temp = (temp - 32) * 5 / 9
-            return round(temp, 1)
+            return _to_celsius(float(match.group(1)), unit == "F")
 
         raise ValueError("Could not extract temperature from page")
 
-    def _extract_condition(self, soup: BeautifulSoup) -> str:
+    def _extract_condition(self, tree: lxml.html.HtmlElement, page_text: str | None = None) -> str:
         """Extract weather condition from the page."""
         # Try to find condition in common locations
-        condition_selectors = [
-            '[class*="condition"]',
-            '[class*="weather"]',
-            '[data-testid*="condition"]',
-            'div[class*="caption"]',
-        ]
-
-        for selector in condition_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
+        for selector in _CONDITION_XPATHS:
+            for element in selector(tree):
+                text = _element_text(element)
                 # Filter out numbers and very short strings
                 if text and len(text) > 2 and not text.isdigit():
                     return str(text)
 
-        # Fallback to searching for common weather terms
-        weather_terms = [
-            "Sunny",
-            "Cloudy",
-            "Partly Cloudy",
-            "Rainy",
-            "Clear",
-            "Overcast",
-            "Thunderstorm",
-        ]
-        page_text = soup.get_text()
-        for term in weather_terms:
+        # Fallback to searching for common weather terms; earlier terms win
+        if page_text is None:
+            page_text = _page_text(tree)
+        for term in _WEATHER_TERMS:
             if term in page_text:
                 return term
 
         return "Unknown"
 
-    def _extract_humidity(self, soup: BeautifulSoup) -> int:
+    def _extract_humidity(self, tree: lxml.html.HtmlElement, page_text: str | None = None) -> int:
         """Extract humidity from the page."""
         # Search for humidity in the page text
-        page_text = soup.get_text()
+        if page_text is None:
+            page_text = _page_text(tree)
         # Look for patterns like "Humidity: 65%" or "65% humidity"
-        match = re.search(r"humidity[:\s]*(\d+)%|(\d+)%\s*humidity", page_text, re.IGNORECASE)
+        match = _HUMIDITY_RE.search(page_text)
         if match:
             humidity_str = match.group(1) or match.group(2)
             return int(humidity_str)
 
         # Try finding elements with humidity in class or attribute
-        humidity_elements = soup.find_all(string=re.compile(r"\d+%"))
-        for element in humidity_elements:
-            if "humid" in str(element.parent).lower():
-                match = re.search(r"(\d+)%", element)
-                if match:
-                    return int(match.group(1))
+        for text in _PERCENT_TEXT_XPATH(tree):
+            match = _PERCENT_RE.search(text)
+            if not match:
+                continue
+            parent = text.getparent()
+            if text.is_tail:
+                parent = parent.getparent()
+            if parent is None:
+                continue
+            if "humid" in lxml.html.tostring(parent, encoding="unicode", with_tail=False).lower():
+                return int(match.group(1))
 
         # Default value if not found
         return 50
 
-    def _extract_wind_speed(self, soup: BeautifulSoup) -> float:
+    def _extract_wind_speed(
+        self, tree: lxml.html.HtmlElement, page_text: str | None = None
+    ) -> float:
         """Extract wind speed from the page."""
         # Search for wind speed in the page text
-        page_text = soup.get_text()
+        if page_text is None:
+            page_text = _page_text(tree)
         # Look for patterns like "Wind: 10 mph" or "10 km/h wind"
-        match = re.search(
-            r"wind[:\s]*(\d+\.?\d*)\s*(mph|km/h|m/s)|(\d+\.?\d*)\s*(mph|km/h|m/s)\s*wind",
-            page_text,
-            re.IGNORECASE,
-        )
+        match = _WIND_RE.search(page_text)
         if match:
             speed_str = match.group(1) or match.group(3)
             unit = match.group(2) or match.group(4)
-            speed = float(speed_str)
-
-            # Convert to km/h
-            if unit.lower() == "mph":
-                speed = speed * 1.60934
-            elif unit.lower() == "m/s":
-                speed = speed * 3.6
-
-            return round(speed, 1)
+            return _to_kmh(float(speed_str), unit.lower())
 
         # Default value if not found
         return 0.0
@@ -404,43 +720,83 @@ class BaseWeatherClient:
                 )
 
             address = location_data.raw.get("address", {})  # type: ignore[union-attr]
-            city = (
-                address.get("city")
-                or address.get("town")
-                or address.get("village")
-                or address.get("county")
-                or "Unknown"
-            )
-            country = address.get("country", "Unknown")
-
-            return Location(city=city, country=country, latitude=latitude, longitude=longitude)
+            return self._location_from_address(address, latitude, longitude)
 
         except LocationNotFoundError:
             raise
         except Exception as e:
             raise WeatherError(f"Failed to reverse geocode coordinates: {str(e)}") from e
 
+    def _location_from_address(
+        self, address: dict[str, str], latitude: float, longitude: float
+    ) -> Location:
+        """Build a Location from a Nominatim address mapping.
+
+        Args:
+            address: The ``address`` object of a Nominatim reverse-geocoding result
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+
+        Returns:
+            Location object with city, country, and coordinates
+        """
+        city = (
+            address.get("city")
+            or address.get("town")
+            or address.get("village")
+            or address.get("county")
+            or "Unknown"
+        )
+        country = address.get("country", "Unknown")
+
+        return Location(city=city, country=country, latitude=latitude, longitude=longitude)
+
 
 class WeatherClient(BaseWeatherClient):
     """Synchronous client for fetching weather data from MSN Weather."""
 
-    def __init__(self, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache_ttl: float = 300,
+        cache_size: int = 256,
+        retries: int = 2,
+        retry_wait: float | None = None,
+    ) -> None:
         """Initialize the weather client.
 
         Args:
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to reuse weather for a location; 0 disables caching
+            cache_size: Maximum number of locations kept in the weather cache
+            retries: Extra attempts after a transient network or 5xx failure
+            retry_wait: Fixed seconds between attempts; None backs off exponentially (2-10s)
         """
-        super().__init__(timeout)
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+        super().__init__(timeout, cache_ttl, cache_size, retries, retry_wait)
+        self.session = _get_shared_session()
 
     @retry(  # type: ignore[misc]
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.RequestException),
+        stop=_retries_exhausted,
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True,
     )
+    def _fetch_html(self, url: str) -> str:
+        """Fetch a page, retrying transient network and server errors.
+
+        Args:
+            url: The MSN Weather URL to fetch
+
+        Returns:
+            The response body
+
+        Raises:
+            requests.RequestException: If the request still fails after retrying
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return str(response.text)
+
     def get_weather(self, location: Location) -> WeatherData:
         """Get current weather data for a location.
 
@@ -454,15 +810,20 @@ class WeatherClient(BaseWeatherClient):
             UpstreamError: If the request fails
             ParsingError: If weather data cannot be parsed from the page
         """
+        cached = self._get_cached_weather(location)
+        if cached is not None:
+            return cached
+
         url = self._get_location_url(location)
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            html = self._fetch_html(url)
         except requests.RequestException as e:
             raise UpstreamError(f"Failed to fetch weather data from MSN: {str(e)}") from e
 
-        return self._parse_weather_response(response.text, location)
+        weather = self._parse_weather_response(html, location)
+        self._cache_weather(weather)
+        return weather
 
     def get_weather_by_coordinates(self, latitude: float, longitude: float) -> WeatherData:
         """Get current weather data for a location by coordinates.
@@ -482,8 +843,8 @@ class WeatherClient(BaseWeatherClient):
         return self.get_weather(location)
 
     def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+        """Release the client's cached weather; the shared HTTP session stays open."""
+        self._cache.clear()
 
     def __enter__(self) -> "WeatherClient":
         """Context manager entry."""
@@ -497,23 +858,58 @@ class WeatherClient(BaseWeatherClient):
 class AsyncWeatherClient(BaseWeatherClient):
     """Asynchronous client for fetching weather data from MSN Weather."""
 
-    def __init__(self, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache_ttl: float = 300,
+        cache_size: int = 256,
+        retries: int = 2,
+        retry_wait: float | None = None,
+    ) -> None:
         """Initialize the async weather client.
 
         Args:
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to reuse weather for a location; 0 disables caching
+            cache_size: Maximum number of locations kept in the weather cache
+            retries: Extra attempts after a transient network or 5xx failure
+            retry_wait: Fixed seconds between attempts; None backs off exponentially (2-10s)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, cache_ttl, cache_size, retries, retry_wait)
+        # Per-location fetch lock and the number of callers holding or waiting on it
+        self._fetch_locks: dict[tuple[str, str], tuple[asyncio.Lock, int]] = {}
         self.client = httpx.AsyncClient(
             timeout=timeout,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=_MAX_CONNECTIONS,
+                max_connections=_MAX_CONNECTIONS,
+            ),
+            headers={"User-Agent": _BROWSER_USER_AGENT},
         )
 
     @retry(  # type: ignore[misc]
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(httpx.HTTPError),
+        stop=_retries_exhausted,
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True,
     )
+    async def _fetch_html(self, url: str) -> str:
+        """Fetch a page, retrying transient network and server errors.
+
+        Args:
+            url: The MSN Weather URL to fetch
+
+        Returns:
+            The response body
+
+        Raises:
+            httpx.HTTPError: If the request still fails after retrying
+        """
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return str(response.text)
+
     async def get_weather(self, location: Location) -> WeatherData:
         """Get current weather data for a location asynchronously.
 
@@ -527,15 +923,39 @@ class AsyncWeatherClient(BaseWeatherClient):
             UpstreamError: If the request fails
             ParsingError: If weather data cannot be parsed from the page
         """
-        url = self._get_location_url(location)
-
+        cached = self._get_cached_weather(location)
+        if cached is not None:
+            return cached
+
+        # Concurrent misses for one location wait for a single fetch instead of all hitting MSN
+        key = (location.city, location.country)
+        entry = self._fetch_locks.get(key)
+        lock, users = entry if entry is not None else (asyncio.Lock(), 0)
+        self._fetch_locks[key] = (lock, users + 1)
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            raise UpstreamError(f"Failed to fetch weather data from MSN: {str(e)}") from e
+            async with lock:
+                cached = self._get_cached_weather(location)
+                if cached is not None:
+                    return cached
+
+                url = self._get_location_url(location)
 
-        return self._parse_weather_response(response.text, location)
+                try:
+                    html = await self._fetch_html(url)
+                except httpx.HTTPError as e:
+                    raise UpstreamError(f"Failed to fetch weather data from MSN: {str(e)}") from e
+
+                weather = self._parse_weather_response(html, location)
+                self._cache_weather(weather)
+                return weather
+        finally:
+            # Drop the lock only once no caller is queued on it; checking lock.locked() is not
+            # enough, since a woken waiter has not re-acquired the lock yet.
+            lock, users = self._fetch_locks[key]
+            if users > 1:
+                self._fetch_locks[key] = (lock, users - 1)
+            else:
+                del self._fetch_locks[key]
 
     async def get_weather_by_coordinates(self, latitude: float, longitude: float) -> WeatherData:
         """Get current weather data for a location by coordinates asynchronously.
@@ -551,10 +971,49 @@ class AsyncWeatherClient(BaseWeatherClient):
             LocationNotFoundError: If location cannot be determined
             WeatherError: If weather data cannot be fetched or parsed
         """
-        # Run synchronous geocoding in a thread pool to avoid blocking the event loop
-        location = await asyncio.to_thread(self._reverse_geocode_to_location, latitude, longitude)
+        location = await self._reverse_geocode_to_location_async(latitude, longitude)
         return await self.get_weather(location)
 
+    async def _reverse_geocode_to_location_async(
+        self, latitude: float, longitude: float
+    ) -> Location:
+        """Reverse geocode coordinates through the Nominatim JSON API without blocking.
+
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+
+        Returns:
+            Location object with city, country, and coordinates
+
+        Raises:
+            LocationNotFoundError: If location cannot be determined
+            WeatherError: If reverse geocoding fails
+        """
+        try:
+            response = await self.client.get(
+                NOMINATIM_REVERSE_URL,
+                params={
+                    "lat": latitude,
+                    "lon": longitude,
+                    "format": "json",
+                    "accept-language": "en",
+                },
+                headers={"User-Agent": GEOCODER_USER_AGENT},
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except Exception as e:
+            raise WeatherError(f"Failed to reverse geocode coordinates: {str(e)}") from e
+
+        address = data.get("address") if isinstance(data, dict) else None
+        if not isinstance(address, dict):
+            raise LocationNotFoundError(
+                f"Could not determine location for coordinates {latitude}, {longitude}"
+            )
+
+        return self._location_from_address(address, latitude, longitude)
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self.client.aclose()
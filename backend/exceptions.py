@@ -15,3 +15,11 @@ class ParsingError(WeatherError):
 
 class LocationNotFoundError(WeatherError):
     """Raised when a location cannot be found or geocoded."""
+
+
+__all__ = [
+    "LocationNotFoundError",
+    "ParsingError",
+    "UpstreamError",
+    "WeatherError",
+]
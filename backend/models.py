@@ -12,6 +12,15 @@ class Location(BaseModel):
     longitude: float | None = Field(default=None, description="Longitude coordinate")
 
 
+class HourlyForecast(BaseModel):
+    """Forecast conditions for one hour."""
+
+    temperature: float = Field(description="Temperature in Celsius")
+    condition: str = Field(description="Weather condition description")
+    humidity: int = Field(ge=0, le=100, description="Humidity percentage")
+    wind_speed: float = Field(ge=0, description="Wind speed in km/h")
+
+
 class WeatherData(BaseModel):
     """Weather data for a location."""
 
@@ -20,3 +29,7 @@ class WeatherData(BaseModel):
     condition: str = Field(description="Weather condition description")
     humidity: int = Field(ge=0, le=100, description="Humidity percentage")
     wind_speed: float = Field(ge=0, description="Wind speed in km/h")
+    hourly: list[HourlyForecast] = Field(
+        default_factory=list,
+        description="Hourly forecast in page order, starting with the current hour, if available",
+    )
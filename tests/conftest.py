@@ -18,12 +18,25 @@ os.environ.setdefault("RATE_LIMIT_GLOBAL", "1000")
 
 @pytest.fixture(autouse=True)
 def clear_cache():
-    """Clear LRU cache before each test to avoid cross-test contamination."""
+    """Clear the weather cache before each test to avoid cross-test contamination."""
     # Import after environment variables are set
-    from backend.api.services import get_cached_weather
+    from backend.api.services import stale_weather_cache, weather_cache
 
-    # Clear the cache before each test
-    get_cached_weather.cache_clear()
+    # Clear the caches before each test
+    weather_cache.clear()
+    stale_weather_cache.clear()
     yield
     # Clear again after test for good measure
-    get_cached_weather.cache_clear()
+    weather_cache.clear()
+    stale_weather_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    """Skip retry backoff so tests that hit failing upstream requests stay fast."""
+    from tenacity import wait_none
+
+    from backend.client import AsyncWeatherClient, WeatherClient
+
+    monkeypatch.setattr(WeatherClient._fetch_html.retry, "wait", wait_none())
+    monkeypatch.setattr(AsyncWeatherClient._fetch_html.retry, "wait", wait_none())
@@ -3,6 +3,8 @@
 # pyright: reportMissingParameterType=false, reportMissingReturnType=false
 
 import json
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -49,6 +51,24 @@ def test_readiness_probe(client: Any) -> Any:
     assert "external_api" in data["checks"]
 
 
+@patch("backend.api.routers.health.get_client")
+def test_readiness_probe_is_cached(mock_get_client: Any, client: Any, monkeypatch: Any) -> Any:
+    """Test that a successful readiness check is reused for subsequent probes."""
+    from backend.api.routers import health
+
+    monkeypatch.setattr(health, "_readiness_cache", None)
+    mock_client = MagicMock()
+    mock_client.session.head.return_value.status_code = 200
+    mock_get_client.return_value = mock_client
+
+    response1 = client.get("/api/v1/health/ready")
+    response2 = client.get("/api/v1/health/ready")
+    assert response1.status_code == 200
+    assert response2.status_code == 200
+    assert json.loads(response2.data)["status"] == "ready"
+    assert mock_client.session.head.call_count == 1
+
+
 def test_get_weather_missing_parameters(client: Any) -> Any:
     """Test GET weather endpoint with missing parameters."""
     response = client.get("/api/v1/weather")
@@ -93,6 +113,58 @@ def test_get_weather_success(mock_get_client: Any, client: Any) -> Any:
     assert data["location"]["country"] == "USA"
 
 
+@patch("backend.api.services.get_client")
+def test_get_weather_conditional_request(mock_get_client: Any, client: Any) -> Any:
+    """Test that weather responses carry an ETag and honour If-None-Match."""
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get_weather.return_value = WeatherData(
+        location=Location(city="Seattle", country="USA"),
+        temperature=15.5,
+        condition="Partly Cloudy",
+        humidity=65,
+        wind_speed=12.5,
+    )
+
+    response = client.get("/api/v1/weather?city=Seattle&country=USA")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert "max-age" in response.headers["Cache-Control"]
+
+    not_modified = client.get(
+        "/api/v1/weather?city=Seattle&country=USA",
+        headers={"If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    assert not_modified.headers["ETag"] == etag
+
+
+@patch("backend.api.services.get_client")
+def test_post_weather_is_not_conditional(mock_get_client: Any, client: Any) -> Any:
+    """Test that POST responses carry no validators and ignore If-None-Match."""
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get_weather.return_value = WeatherData(
+        location=Location(city="Seattle", country="USA"),
+        temperature=15.5,
+        condition="Partly Cloudy",
+        humidity=65,
+        wind_speed=12.5,
+    )
+
+    etag = client.get("/api/v1/weather?city=Seattle&country=USA").headers["ETag"]
+    response = client.post(
+        "/api/v1/weather",
+        json={"city": "Seattle", "country": "USA"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert "Cache-Control" not in response.headers
+    assert json.loads(response.data)["condition"] == "Partly Cloudy"
+
+
 def test_post_weather_missing_body(client: Any) -> Any:
     """Test POST weather endpoint with missing body."""
     response = client.post("/api/v1/weather", data=json.dumps({}), content_type="application/json")
@@ -150,9 +222,9 @@ def test_post_weather_success(mock_get_client: Any, client: Any) -> Any:
 def test_get_weather_client_error(mock_get_client: Any, client: Any) -> Any:
     """Test GET weather endpoint when client raises an error."""
     # Clear the cache to ensure mock is used
-    from backend.api.services import get_cached_weather
+    from backend.api.services import weather_cache
 
-    get_cached_weather.cache_clear()
+    weather_cache.clear()
 
     # Setup mock to raise exception
     mock_client = MagicMock()
@@ -170,9 +242,9 @@ def test_get_weather_client_error(mock_get_client: Any, client: Any) -> Any:
 def test_post_weather_client_error(mock_get_client: Any, client: Any) -> Any:
     """Test POST weather endpoint when client raises an error."""
     # Clear the cache to ensure mock is used
-    from backend.api.services import get_cached_weather
+    from backend.api.services import weather_cache
 
-    get_cached_weather.cache_clear()
+    weather_cache.clear()
 
     # Setup mock to raise exception
     mock_client = MagicMock()
@@ -212,10 +284,10 @@ def test_invalid_endpoint(client: Any) -> Any:
 @patch("backend.api.services.get_client")
 def test_weather_caching_same_bucket(mock_get_client: Any, client: Any) -> Any:
     """Test that weather data is cached within the same time bucket."""
-    from backend.api.services import get_cached_weather
+    from backend.api.services import weather_cache
 
     # Clear cache before test
-    get_cached_weather.cache_clear()
+    weather_cache.clear()
 
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
@@ -244,21 +316,19 @@ def test_weather_caching_same_bucket(mock_get_client: Any, client: Any) -> Any:
 
 
 @patch("backend.api.services.get_client")
-@patch("backend.api.services.datetime")
-def test_weather_cache_invalidation(mock_datetime: Any, mock_get_client: Any, client: Any) -> Any:
-    """Test that cache is invalidated across different time buckets."""
+@patch("backend.cache.time")
+def test_weather_cache_invalidation(mock_time: Any, mock_get_client: Any, client: Any) -> Any:
+    """Test that cached entries expire after the cache duration."""
 
-    from backend.api.services import get_cached_weather
+    from backend.api.services import weather_cache
 
-    get_cached_weather.cache_clear()
+    weather_cache.clear()
 
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
 
-    # Mock first time bucket (minute 0)
-    mock_dt1 = MagicMock()
-    mock_dt1.minute = 0
-    mock_datetime.now.return_value = mock_dt1
+    # Entry is stored at t=1000s
+    mock_time.monotonic.return_value = 1000.0
 
     mock_weather1 = WeatherData(
         location=Location(city="London", country="UK"),
@@ -273,10 +343,8 @@ def test_weather_cache_invalidation(mock_datetime: Any, mock_get_client: Any, cl
     assert response1.status_code == 200
     assert mock_client.get_weather.call_count == 1
 
-    # Mock second time bucket (minute 5)
-    mock_dt2 = MagicMock()
-    mock_dt2.minute = 5
-    mock_datetime.now.return_value = mock_dt2
+    # More than 5 minutes later the entry has expired
+    mock_time.monotonic.return_value = 1301.0
 
     mock_weather2 = WeatherData(
         location=Location(city="London", country="UK"),
@@ -289,7 +357,7 @@ def test_weather_cache_invalidation(mock_datetime: Any, mock_get_client: Any, cl
 
     response2 = client.get("/api/v1/weather?city=London&country=UK")
     assert response2.status_code == 200
-    assert mock_client.get_weather.call_count == 2  # Cache miss, new bucket
+    assert mock_client.get_weather.call_count == 2  # Cache miss, entry expired
 
     data2 = json.loads(response2.data)
     assert data2["temperature"] == 22.0
@@ -299,16 +367,16 @@ def test_weather_cache_invalidation(mock_datetime: Any, mock_get_client: Any, cl
 @patch("backend.api.services.get_client")
 def test_cache_with_different_locations(mock_get_client: Any, client: Any) -> Any:
     """Test that cache stores different locations separately."""
-    from backend.api.services import get_cached_weather
+    from backend.api.services import weather_cache
 
-    get_cached_weather.cache_clear()
+    weather_cache.clear()
 
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
 
     # Different weather for different cities
     def get_weather_side_effect(location: Any) -> Any:
-        if location.city == "London":
+        if location.city.casefold() == "london":
             return WeatherData(
                 location=location,
                 temperature=20.0,
@@ -344,6 +412,123 @@ def test_cache_with_different_locations(mock_get_client: Any, client: Any) -> An
     assert mock_client.get_weather.call_count == 2
 
 
+@patch("backend.api.services.get_client")
+def test_cache_is_case_insensitive(mock_get_client: Any, client: Any) -> Any:
+    """Test that differently-cased queries share one cache entry."""
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get_weather.side_effect = lambda location: WeatherData(
+        location=location,
+        temperature=20.0,
+        condition="Cloudy",
+        humidity=75,
+        wind_speed=15.0,
+    )
+
+    response1 = client.get("/api/v1/weather?city=London&country=UK")
+    response2 = client.get("/api/v1/weather?city=LONDON&country=uk")
+    assert response1.status_code == 200
+    assert response2.status_code == 200
+    assert mock_client.get_weather.call_count == 1
+
+    # Each response echoes the caller's spelling of the location
+    assert json.loads(response1.data)["location"]["city"] == "London"
+    assert json.loads(response2.data)["location"]["city"] == "LONDON"
+    assert json.loads(response2.data)["location"]["country"] == "uk"
+
+
+@patch("backend.api.services.get_client")
+def test_concurrent_misses_share_one_fetch(mock_get_client: Any) -> Any:
+    """Test that concurrent cache misses for one location make a single upstream call."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from backend.api.services import get_cached_weather
+
+    release = threading.Event()
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+
+    def slow_get_weather(location: Any) -> Any:
+        release.wait(timeout=5)
+        return WeatherData(
+            location=location,
+            temperature=20.0,
+            condition="Cloudy",
+            humidity=75,
+            wind_speed=15.0,
+        )
+
+    mock_client.get_weather.side_effect = slow_get_weather
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(get_cached_weather, "london", "uk") for _ in range(5)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert mock_client.get_weather.call_count == 1
+    assert all(status_code == 200 for _, status_code in results)
+
+
+@patch("backend.api.services.get_client")
+def test_stale_weather_served_on_upstream_error(mock_get_client: Any, client: Any) -> Any:
+    """Test that the last good payload is served when the upstream fetch fails."""
+    from backend.api.services import weather_cache
+    from backend.exceptions import UpstreamError
+
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get_weather.return_value = WeatherData(
+        location=Location(city="London", country="UK"),
+        temperature=20.0,
+        condition="Cloudy",
+        humidity=75,
+        wind_speed=15.0,
+    )
+
+    response1 = client.get("/api/v1/weather?city=London&country=UK")
+    assert response1.status_code == 200
+    assert "stale" not in json.loads(response1.data)
+
+    # Expire the fresh entry and make the upstream fail
+    weather_cache.clear()
+    mock_client.get_weather.side_effect = UpstreamError("MSN unavailable")
+
+    response2 = client.get("/api/v1/weather?city=London&country=UK")
+    assert response2.status_code == 200
+    data = json.loads(response2.data)
+    assert data["stale"] is True
+    assert data["temperature"] == 20.0
+
+
+def test_stale_weather_served_without_retry_backoff(
+    monkeypatch: pytest.MonkeyPatch, client: Any
+) -> Any:
+    """Test that the shared client gives up at once so stale data is served promptly."""
+    import requests
+
+    from backend.api import services
+    from backend.client import WeatherClient, _retry_wait
+
+    # Restore the real backoff that the autouse fixture skips
+    monkeypatch.setattr(WeatherClient._fetch_html.retry, "wait", _retry_wait)
+    monkeypatch.setattr(services, "_weather_client", None)
+    payload = {"location": {"city": "London", "country": "UK"}, "temperature": 20.0}
+    services.stale_weather_cache.set(("london", "uk"), payload)
+
+    with patch.object(
+        requests.Session, "get", side_effect=requests.ConnectionError("MSN unavailable")
+    ) as mock_get:
+        started = time.monotonic()
+        response = client.get("/api/v1/weather?city=London&country=UK")
+        elapsed = time.monotonic() - started
+
+    assert response.status_code == 200
+    assert json.loads(response.data)["stale"] is True
+    assert mock_get.call_count == 1
+    assert elapsed < 1
+
+
 def test_cache_size_configuration() -> Any:
     """Test that cache size is configurable."""
     import os
@@ -364,6 +549,15 @@ def test_cache_duration_configuration() -> Any:
     assert CACHE_DURATION_MINUTES == expected
 
 
+@pytest.mark.parametrize(("value", "expected"), [("debug", "DEBUG"), ("verbose", "INFO")])
+def test_log_level_configuration(monkeypatch: pytest.MonkeyPatch, value: str, expected: str) -> Any:
+    """Test that LOG_LEVEL is normalized and unknown names fall back to INFO."""
+    from backend.api.config import get_log_level
+
+    monkeypatch.setenv("LOG_LEVEL", value)
+    assert get_log_level() == expected
+
+
 # Error Handler Tests
 
 
@@ -396,8 +590,8 @@ def test_oversized_request_body(client: Any) -> Any:
         data=json.dumps(huge_data),
         content_type="application/json",
     )
-    # Should be rejected by validation
-    assert response.status_code == 400
+    # Should be rejected before the body is parsed
+    assert response.status_code == 413
     data = json.loads(response.data)
     assert "error" in data
 
@@ -418,9 +612,10 @@ def test_x_request_id_header(client: Any) -> Any:
 @patch("backend.api.services.get_client")
 def test_cache_zero_duration(mock_get_client: Any, client: Any, monkeypatch: Any) -> Any:
     """Test cache behavior when CACHE_DURATION is 0."""
-    # Test that the code handles zero cache duration without division by zero
-    # The actual CACHE_DURATION_MINUTES will be calculated on module import
-    # but we can verify the division protection works
+    from backend.api.services import weather_cache
+
+    # A zero duration disables caching rather than caching forever
+    monkeypatch.setattr(weather_cache, "ttl", 0)
 
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
@@ -433,13 +628,14 @@ def test_cache_zero_duration(mock_get_client: Any, client: Any, monkeypatch: Any
     )
     mock_client.get_weather.return_value = mock_weather
 
-    # Should work regardless of cache duration setting
-    # When CACHE_DURATION_MINUTES is 0, minute_bucket is also 0 (safe default)
     response = client.get("/api/v1/weather?city=London&country=UK")
     assert response.status_code == 200
     data = json.loads(response.data)
     assert data["location"]["city"] == "London"
 
+    client.get("/api/v1/weather?city=London&country=UK")
+    assert mock_client.get_weather.call_count == 2
+
 
 def test_weather_coordinates_endpoint(client: Any) -> Any:
     """Test weather by coordinates endpoint."""
@@ -473,6 +669,18 @@ def test_weather_coordinates_invalid_longitude(client: Any) -> Any:
     assert "error" in data
 
 
+@pytest.mark.parametrize(
+    "lat, lon",
+    [("nan", "0"), ("inf", "0"), ("1e1", "0"), ("47", "-1E2"), ("47.6.1", "0"), ("abc", "0")],
+)
+def test_weather_coordinates_non_decimal_rejected(client: Any, lat: str, lon: str) -> Any:
+    """Test that NaN, infinity, exponents and malformed numbers are rejected."""
+    response = client.get(f"/api/v1/weather/coordinates?lat={lat}&lon={lon}")
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data["error"] == "Invalid coordinates"
+
+
 def test_recent_searches_get(client: Any) -> Any:
     """Test getting recent searches."""
     response = client.get("/api/v1/recent-searches")
@@ -490,6 +698,54 @@ def test_recent_searches_delete(client: Any) -> Any:
     assert "message" in data
 
 
+@patch("backend.api.services.get_client")
+def test_recent_searches_use_session_cookie(mock_get_client: Any, client: Any) -> Any:
+    """Test that a weather lookup starts a cookie session that recent searches follow."""
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+    mock_client.get_weather.return_value = WeatherData(
+        location=Location(city="Seattle", country="USA"),
+        temperature=15.5,
+        condition="Partly Cloudy",
+        humidity=65,
+        wind_speed=12.5,
+    )
+
+    response = client.get("/api/v1/weather?city=Seattle&country=USA")
+    assert response.status_code == 200
+    assert "sid=" in response.headers["set-cookie"]
+    assert "httponly" in response.headers["set-cookie"].lower()
+
+    data = json.loads(client.get("/api/v1/recent-searches").data)
+    assert data["recent_searches"] == [{"city": "Seattle", "country": "USA"}]
+
+    health = client.get("/api/v1/health")
+    assert "set-cookie" not in health.headers
+
+
+def test_recent_searches_evicts_least_recent_session(monkeypatch: Any) -> Any:
+    """Test that the per-session recent-search store is bounded."""
+    from types import SimpleNamespace
+
+    from backend.api import services
+
+    monkeypatch.setattr(services, "RECENT_SEARCH_SESSIONS", 2)
+    monkeypatch.setattr(services, "recent_searches", services.OrderedDict())
+    session_requests = [SimpleNamespace(cookies={}, state=SimpleNamespace()) for _ in range(3)]
+
+    services.add_to_recent_searches(session_requests[0], "London", "UK")
+    services.add_to_recent_searches(session_requests[1], "Paris", "France")
+    services.add_to_recent_searches(session_requests[0], "Berlin", "Germany")  # refresh session 0
+    services.add_to_recent_searches(session_requests[2], "Rome", "Italy")
+
+    assert services.get_recent_search_history(session_requests[1]) == []
+    assert services.get_recent_search_history(session_requests[0]) == [
+        {"city": "Berlin", "country": "Germany"},
+        {"city": "London", "country": "UK"},
+    ]
+    assert len(services.recent_searches) == 2
+
+
 def test_versioned_weather_get(client: Any) -> Any:
     """Test versioned weather GET endpoint."""
     response = client.get("/api/v1/weather?city=Seattle&country=USA")
@@ -69,16 +69,14 @@ def test_weather_data_creation_benchmark(benchmark):
 @pytest.mark.benchmark(group="parsing")
 def test_temperature_parsing_benchmark(benchmark):
     """Benchmark temperature value parsing."""
-    from bs4 import BeautifulSoup
-
-    from backend.client import WeatherClient
+    from backend.client import WeatherClient, _parse_html
 
     client = WeatherClient()
     html_content = '<span class="cur-temp">72°</span>'
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = _parse_html(html_content)
 
     def parse_temp():
-        return client._extract_temperature(soup)
+        return client._extract_temperature(tree)
 
     result = benchmark(parse_temp)
     assert result == 72.0
@@ -87,16 +85,14 @@ def test_temperature_parsing_benchmark(benchmark):
 @pytest.mark.benchmark(group="parsing")
 def test_condition_parsing_benchmark(benchmark):
     """Benchmark weather condition extraction."""
-    from bs4 import BeautifulSoup
-
-    from backend.client import WeatherClient
+    from backend.client import WeatherClient, _parse_html
 
     client = WeatherClient()
     html_content = '<div class="condition">Sunny</div>'
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = _parse_html(html_content)
 
     def parse_condition():
-        return client._extract_condition(soup)
+        return client._extract_condition(tree)
 
     result = benchmark(parse_condition)
     assert result == "Sunny"
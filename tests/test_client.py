@@ -1,18 +1,20 @@
 """Tests for the weather client."""
 
+import asyncio
 from unittest.mock import Mock, patch
 
+import httpx
+import orjson
 import pytest
 import requests
-from bs4 import BeautifulSoup
 
-from backend.client import WeatherClient
+from backend.client import WeatherClient, _build_location_url, _parse_html
 from backend.exceptions import (
     LocationNotFoundError,
     UpstreamError,
     WeatherError,
 )
-from backend.models import Location
+from backend.models import Location, WeatherData
 
 
 def test_weather_client_initialization() -> None:
@@ -23,6 +25,13 @@ def test_weather_client_initialization() -> None:
     client.close()
 
 
+def test_weather_clients_share_session_and_geocoder() -> None:
+    """Test that client instances reuse one HTTP session and geocoder."""
+    with WeatherClient() as first, WeatherClient() as second:
+        assert first.session is second.session
+        assert first.geocoder is second.geocoder
+
+
 def test_weather_client_context_manager() -> None:
     """Test weather client works as context manager."""
     with WeatherClient() as client:
@@ -58,6 +67,19 @@ def test_get_weather_live() -> None:
             pytest.skip(f"MSN Weather website structure may have changed: {e}")
 
 
+def test_get_location_url_is_encoded_and_cached() -> None:
+    """Test that location URLs are URL-encoded and memoized per location."""
+    client = WeatherClient()
+    location = Location(city="São Paulo", country="Brazil")
+    url = client._get_location_url(location)
+    assert url == f"{client.base_url}S%C3%A3o%20Paulo%2CBrazil"
+
+    hits = _build_location_url.cache_info().hits
+    assert client._get_location_url(location) == url
+    assert _build_location_url.cache_info().hits == hits + 1
+    client.close()
+
+
 def test_extract_temperature() -> None:
     """Test temperature extraction from HTML."""
     html = """
@@ -67,9 +89,9 @@ def test_extract_temperature() -> None:
         </body>
     </html>
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    temp = client._extract_temperature(soup)
+    temp = client._extract_temperature(tree)
     assert isinstance(temp, float)
     assert 20 <= temp <= 25  # 72°F is approximately 22°C
     client.close()
@@ -84,9 +106,9 @@ def test_extract_condition() -> None:
         </body>
     </html>
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    condition = client._extract_condition(soup)
+    condition = client._extract_condition(tree)
     assert condition == "Partly Cloudy"
     client.close()
 
@@ -100,13 +122,29 @@ def test_extract_humidity() -> None:
         </body>
     </html>
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    humidity = client._extract_humidity(soup)
+    humidity = client._extract_humidity(tree)
     assert humidity == 65
     client.close()
 
 
+def test_extract_humidity_after_non_breaking_space() -> None:
+    """Test humidity extraction when the label is followed by a non-breaking space."""
+    tree = _parse_html("<html><body><div>Humidity:\u00a065%</div></body></html>")
+    client = WeatherClient()
+    assert client._extract_humidity(tree) == 65
+    client.close()
+
+
+def test_extract_humidity_ignores_tail_text() -> None:
+    """Test that text after a percentage element does not count as a humidity label."""
+    tree = _parse_html("<html><body><p><span>75%</span> humid</p></body></html>")
+    client = WeatherClient()
+    assert client._extract_humidity(tree, page_text="") == 50
+    client.close()
+
+
 def test_extract_wind_speed() -> None:
     """Test wind speed extraction from HTML."""
     html = """
@@ -116,9 +154,9 @@ def test_extract_wind_speed() -> None:
         </body>
     </html>
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    wind_speed = client._extract_wind_speed(soup)
+    wind_speed = client._extract_wind_speed(tree)
     assert isinstance(wind_speed, float)
     assert wind_speed > 0  # 10 mph converted to km/h
     client.close()
@@ -160,6 +198,87 @@ def test_extract_weather_from_json_success() -> None:
     client.close()
 
 
+def test_extract_weather_from_json_skips_dom_parse() -> None:
+    """Test that the embedded state script is read without building a DOM."""
+    html = """
+    <html>
+        <body>
+            <script>var config = {};</script>
+            <script type="application/json">
+            {"WeatherData": {"_@STATE@_": {"currentCondition": {
+                "currentTemperature": "20", "degreeSetting": "C", "shortCap": "Sunny",
+                "humidity": "40%", "windSpeedNumber": "5", "windSpeedUnit": "km/h"
+            }}}}
+            </script>
+        </body>
+    </html>
+    """
+    client = WeatherClient()
+    with patch("backend.client._parse_html") as mock_parse_html:
+        result = client._extract_weather_from_json(html)
+    mock_parse_html.assert_not_called()
+    assert result == {
+        "temperature": 20.0,
+        "condition": "Sunny",
+        "humidity": 40,
+        "wind_speed": 5.0,
+        "hourly": [],
+    }
+    client.close()
+
+
+def test_extract_weather_from_json_scans_all_json_scripts() -> None:
+    """Test that JSON scripts are scanned when the first marker is outside one."""
+    html = """
+    <html>
+        <body>
+            <script>window.stateKeys = ['"WeatherData"'];</script>
+            <script type="application/json">{"config": {}}</script>
+            <script type="application/json">
+            {"WeatherData": {"_@STATE@_": {"currentCondition": {
+                "currentTemperature": "50", "degreeSetting": "°F", "shortCap": "Rain",
+                "humidity": "90", "windSpeedNumber": "10", "windSpeedUnit": "mph"
+            }}}}
+            </script>
+        </body>
+    </html>
+    """
+    client = WeatherClient()
+    with patch("backend.client._RAW_TEMP_RE") as mock_raw_temp:
+        result = client._extract_weather_from_json(html)
+    mock_raw_temp.search.assert_not_called()
+    assert result == {
+        "temperature": 10.0,
+        "condition": "Rain",
+        "humidity": 90,
+        "wind_speed": 16.1,
+        "hourly": [],
+    }
+    client.close()
+
+
+def test_extract_weather_from_json_numeric_fields() -> None:
+    """Test that numeric JSON fields are used without string parsing."""
+    html = """
+    <script type="application/json">
+    {"WeatherData": {"_@STATE@_": {"currentCondition": {
+        "currentTemperature": 68, "shortCap": "Fair",
+        "humidity": 40, "windSpeedNumber": 10, "windSpeedUnit": "mph"
+    }}}}
+    </script>
+    """
+    client = WeatherClient()
+    result = client._extract_weather_from_json(html)
+    assert result == {
+        "temperature": 20.0,
+        "condition": "Fair",
+        "humidity": 40,
+        "wind_speed": 16.1,
+        "hourly": [],
+    }
+    client.close()
+
+
 def test_extract_weather_from_json_no_script_tag() -> None:
     """Test weather extraction when no script tag exists."""
     html = "<html><body>No weather data here</body></html>"
@@ -245,6 +364,157 @@ def test_get_weather_with_json_extraction(mock_get) -> None:
     client.close()
 
 
+STATE_HTML = """
+<script type="application/json">
+{"WeatherData": {"_@STATE@_": {"currentCondition": {
+    "currentTemperature": "21", "degreeSetting": "C", "shortCap": "Clear",
+    "humidity": "55", "windSpeedNumber": "7", "windSpeedUnit": "km/h"
+}}}}
+</script>
+"""
+
+
+def test_parse_weather_response_parses_html_once_on_json_miss() -> None:
+    """Test that the script scan and selector fallback share one parsed document."""
+    html = """
+    <html><body>
+        <script type="application/json">{"WeatherData": {}}</script>
+        <div class="temperature">72°F</div>
+        <div class="condition">Sunny</div>
+        <p>Humidity: 65%</p>
+        <p>Wind: 10 mph</p>
+    </body></html>
+    """
+    client = WeatherClient()
+    with patch("backend.client._parse_html", wraps=_parse_html) as mock_parse_html:
+        weather = client._parse_weather_response(html, Location(city="Oslo", country="Norway"))
+    assert mock_parse_html.call_count == 1
+    assert weather.condition == "Sunny"
+    client.close()
+
+
+def test_parse_weather_response_clamps_out_of_range_values() -> None:
+    """Test that parsed humidity and wind speed are kept within the model's bounds."""
+    html = STATE_HTML.replace('"55"', '"150"').replace('"7"', '"-3"')
+    client = WeatherClient()
+    weather = client._parse_weather_response(html, Location(city="Oslo", country="Norway"))
+    assert weather.humidity == 100
+    assert weather.wind_speed == 0.0
+    client.close()
+
+
+def test_parse_weather_response_includes_hourly_forecast() -> None:
+    """Test that every hourly forecast entry is converted like the current conditions."""
+    html = """
+    <script type="application/json">
+    {"WeatherData": {"_@STATE@_": {"unit": "F", "forecast": [{"hourly": [
+        {"temperature": 50, "cap": "Rain", "humidity": 90,
+         "windSpeedNumber": 10, "windSpeedUnit": "mph"},
+        {"temperature": 68, "cap": "Sunny", "humidity": 120,
+         "windSpeedNumber": 5, "windSpeedUnit": "mph"}
+    ]}]}}}
+    </script>
+    """
+    client = WeatherClient()
+    weather = client._parse_weather_response(html, Location(city="Oslo", country="Norway"))
+    assert weather.temperature == 10.0
+    assert [hour.temperature for hour in weather.hourly] == [10.0, 20.0]
+    assert [hour.condition for hour in weather.hourly] == ["Rain", "Sunny"]
+    assert [hour.humidity for hour in weather.hourly] == [90, 100]
+    assert [hour.wind_speed for hour in weather.hourly] == [16.1, 8.0]
+    client.close()
+
+
+@patch("backend.client.requests.Session.get")
+def test_get_weather_uses_client_cache(mock_get) -> None:
+    """Test repeated lookups for a location are served from the client cache."""
+    mock_get.return_value = Mock(text=STATE_HTML, status_code=200)
+
+    client = WeatherClient()
+    first = client.get_weather(Location(city="Oslo", country="Norway"))
+    located = Location(city="Oslo", country="Norway", latitude=59.91, longitude=10.75)
+    second = client.get_weather(located)
+
+    assert mock_get.call_count == 1
+    assert second.temperature == first.temperature
+    assert second.location == located
+    client.close()
+
+
+@patch("backend.client.requests.Session.get")
+def test_get_weather_cache_disabled(mock_get) -> None:
+    """Test that a zero cache TTL fetches on every call."""
+    mock_get.return_value = Mock(text=STATE_HTML, status_code=200)
+
+    client = WeatherClient(cache_ttl=0)
+    client.get_weather(Location(city="Oslo", country="Norway"))
+    client.get_weather(Location(city="Oslo", country="Norway"))
+
+    assert mock_get.call_count == 2
+    client.close()
+
+
+@pytest.mark.asyncio
+@patch("backend.client.httpx.AsyncClient.get")
+async def test_async_get_weather_concurrent_calls_share_fetch(mock_get: Mock) -> None:
+    """Test concurrent async lookups for one location make a single upstream request."""
+    from backend.client import AsyncWeatherClient
+
+    async def slow_get(url: str, **kwargs: object) -> Mock:
+        await asyncio.sleep(0.01)
+        return Mock(text=STATE_HTML, status_code=200)
+
+    mock_get.side_effect = slow_get
+
+    async with AsyncWeatherClient() as client:
+        results = await asyncio.gather(
+            *(client.get_weather(Location(city="Oslo", country="Norway")) for _ in range(5))
+        )
+
+    assert mock_get.call_count == 1
+    assert {weather.condition for weather in results} == {"Clear"}
+
+
+@pytest.mark.asyncio
+async def test_async_get_weather_keeps_lock_for_queued_waiter() -> None:
+    """Test a caller arriving after a failed fetch queues behind the waiter, not beside it."""
+    from backend.client import AsyncWeatherClient
+
+    location = Location(city="Oslo", country="Norway")
+    late_callers: list[asyncio.Task[WeatherData]] = []
+    active = 0
+    max_active = 0
+    calls = 0
+
+    async with AsyncWeatherClient() as client:
+
+        async def fetch_html(url: str) -> str:
+            nonlocal active, max_active, calls
+            calls += 1
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if calls == 1:
+                # Arrives while the first fetch fails and a second caller is still queued
+                late_callers.append(asyncio.create_task(client.get_weather(location)))
+                raise httpx.ConnectError("upstream down")
+            return STATE_HTML
+
+        client._fetch_html = fetch_html  # type: ignore[method-assign]
+        results = await asyncio.gather(
+            client.get_weather(location), client.get_weather(location), return_exceptions=True
+        )
+        late_result = await late_callers[0]
+
+    assert isinstance(results[0], UpstreamError)
+    assert isinstance(results[1], WeatherData)
+    assert late_result.condition == "Clear"
+    assert max_active == 1
+    assert calls == 2
+    assert client._fetch_locks == {}
+
+
 @patch("backend.client.requests.Session.get")
 def test_get_weather_fallback_to_html(mock_get) -> None:
     """Test get_weather falls back to HTML parsing when JSON fails."""
@@ -289,50 +559,117 @@ def test_get_weather_request_exception(mock_get) -> None:
     client.close()
 
 
+@patch("backend.client.requests.Session.get")
+def test_get_weather_retries_transient_errors(mock_get) -> None:
+    """Test that only the page fetch is retried after a transient network error."""
+    mock_get.side_effect = [
+        requests.ConnectionError("Connection reset"),
+        Mock(text=STATE_HTML, status_code=200),
+    ]
+
+    client = WeatherClient()
+    weather = client.get_weather(Location(city="Oslo", country="Norway"))
+
+    assert mock_get.call_count == 2
+    assert weather.condition == "Clear"
+    client.close()
+
+
+@pytest.mark.parametrize("retries", [0, 1])
+@patch("backend.client.requests.Session.get")
+def test_get_weather_honours_configured_retries(mock_get, retries) -> None:
+    """Test that a client makes one attempt plus its configured number of retries."""
+    mock_get.side_effect = requests.ConnectionError("Connection reset")
+
+    client = WeatherClient(retries=retries, retry_wait=0)
+    with pytest.raises(UpstreamError):
+        client.get_weather(Location(city="Oslo", country="Norway"))
+
+    assert mock_get.call_count == retries + 1
+    client.close()
+
+
+@patch("backend.client.requests.Session.get")
+def test_get_weather_does_not_retry_client_errors(mock_get) -> None:
+    """Test that 4xx responses from MSN fail without retrying."""
+    response = requests.Response()
+    response.status_code = 404
+    mock_get.return_value = response
+
+    client = WeatherClient()
+    with pytest.raises(UpstreamError):
+        client.get_weather(Location(city="Nowhere", country="Noland"))
+
+    assert mock_get.call_count == 1
+    client.close()
+
+
 def test_fahrenheit_to_celsius_conversion() -> None:
     """Test temperature conversion logic."""
     client = WeatherClient()
 
     # Test with known values
     html_32f = '<span class="temp">32°F</span>'
-    soup = BeautifulSoup(html_32f, "lxml")
-    temp = client._extract_temperature(soup)
+    tree = _parse_html(html_32f)
+    temp = client._extract_temperature(tree)
     assert abs(temp - 0.0) < 0.1  # 32°F = 0°C
 
     html_212f = '<span class="temp">212°F</span>'
-    soup = BeautifulSoup(html_212f, "lxml")
-    temp = client._extract_temperature(soup)
+    tree = _parse_html(html_212f)
+    temp = client._extract_temperature(tree)
     assert abs(temp - 100.0) < 0.1  # 212°F = 100°C
 
     client.close()
 
 
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        ("<div>Current weather</div><div>Feels 10</div><div>72°F</div>", 22.2),
+        ("<p>Current weather</p><span>10</span><span>72°</span>", 72.0),
+    ],
+)
+def test_extract_temperature_keeps_adjacent_text_nodes_apart(html: str, expected: float) -> None:
+    """Test that numbers in neighbouring text nodes are not joined into one value."""
+    client = WeatherClient()
+    assert client._extract_temperature(_parse_html(html)) == expected
+    client.close()
+
+
 def test_extract_temperature_not_found() -> None:
     """Test temperature extraction when element not found."""
     html = "<html><body>No temperature here</body></html>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
     with pytest.raises(ValueError, match="Could not extract temperature from page"):
-        client._extract_temperature(soup)
+        client._extract_temperature(tree)
     client.close()
 
 
 def test_extract_condition_not_found() -> None:
     """Test condition extraction when element not found."""
     html = "<html><body>No condition here</body></html>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    condition = client._extract_condition(soup)
+    condition = client._extract_condition(tree)
     assert condition == "Unknown"  # Default value
     client.close()
 
 
+def test_extract_condition_term_priority() -> None:
+    """Test that the term fallback prefers earlier terms over earlier text positions."""
+    tree = _parse_html("<html><body><p>Overcast this morning, Sunny later</p></body></html>")
+    client = WeatherClient()
+    assert client._extract_condition(tree) == "Sunny"
+    client.close()
+
+
 def test_extract_humidity_not_found() -> None:
     """Test humidity extraction when element not found."""
     html = "<html><body>No humidity here</body></html>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    humidity = client._extract_humidity(soup)
+    humidity = client._extract_humidity(tree)
     assert humidity == 50  # Default value when not found
     client.close()
 
@@ -340,9 +677,9 @@ def test_extract_humidity_not_found() -> None:
 def test_extract_wind_speed_not_found() -> None:
     """Test wind speed extraction when element not found."""
     html = "<html><body>No wind data here</body></html>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    wind_speed = client._extract_wind_speed(soup)
+    wind_speed = client._extract_wind_speed(tree)
     assert wind_speed == 0.0  # Default value
     client.close()
 
@@ -350,9 +687,9 @@ def test_extract_wind_speed_not_found() -> None:
 def test_mph_to_kmh_conversion() -> None:
     """Test wind speed conversion from mph to km/h."""
     html = "<div>Wind: 10 mph</div>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    wind_speed = client._extract_wind_speed(soup)
+    wind_speed = client._extract_wind_speed(tree)
     expected = 10 * 1.60934  # mph to km/h
     assert abs(wind_speed - expected) < 0.1
     client.close()
@@ -361,9 +698,9 @@ def test_mph_to_kmh_conversion() -> None:
 def test_ms_to_kmh_conversion() -> None:
     """Test wind speed conversion from m/s to km/h."""
     html = "<div>Wind: 10 m/s</div>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    wind_speed = client._extract_wind_speed(soup)
+    wind_speed = client._extract_wind_speed(tree)
     expected = 10 * 3.6  # m/s to km/h
     assert abs(wind_speed - expected) < 0.1
     client.close()
@@ -459,19 +796,17 @@ def test_extract_weather_json_exception() -> None:
 def test_humidity_extraction_with_parent_element() -> None:
     """Test humidity extraction when found in parent element."""
     html = "<div class='humidity'>75%</div>"
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
     client = WeatherClient()
-    humidity = client._extract_humidity(soup)
+    humidity = client._extract_humidity(tree)
     assert humidity == 75
     client.close()
 
 
-@patch("backend.client.Nominatim")
-def test_get_weather_by_coordinates_geocode_failure(mock_nominatim: Mock) -> None:
+@patch("backend.client.Nominatim.reverse")
+def test_get_weather_by_coordinates_geocode_failure(mock_reverse: Mock) -> None:
     """Test get_weather_by_coordinates when geocoding fails."""
-    mock_geocoder = Mock()
-    mock_geocoder.reverse.return_value = None
-    mock_nominatim.return_value = mock_geocoder
+    mock_reverse.return_value = None
 
     client = WeatherClient()
     with pytest.raises(LocationNotFoundError, match="Could not determine location for coordinates"):
@@ -479,12 +814,10 @@ def test_get_weather_by_coordinates_geocode_failure(mock_nominatim: Mock) -> Non
     client.close()
 
 
-@patch("backend.client.Nominatim")
-def test_get_weather_by_coordinates_geocode_exception(mock_nominatim: Mock) -> None:
+@patch("backend.client.Nominatim.reverse")
+def test_get_weather_by_coordinates_geocode_exception(mock_reverse: Mock) -> None:
     """Test get_weather_by_coordinates when geocoding raises exception."""
-    mock_geocoder = Mock()
-    mock_geocoder.reverse.side_effect = Exception("Geocoding API error")
-    mock_nominatim.return_value = mock_geocoder
+    mock_reverse.side_effect = Exception("Geocoding API error")
 
     client = WeatherClient()
     with pytest.raises(WeatherError, match="Failed to reverse geocode coordinates"):
@@ -492,21 +825,22 @@ def test_get_weather_by_coordinates_geocode_exception(mock_nominatim: Mock) -> N
     client.close()
 
 
+def _nominatim_response(payload: object) -> Mock:
+    response = Mock()
+    response.content = orjson.dumps(payload)
+    return response
+
+
 @pytest.mark.asyncio
-@patch("backend.client.Nominatim")
 @patch("backend.client.httpx.AsyncClient.get")
-async def test_async_get_weather_by_coordinates_success(
-    mock_get: Mock, mock_nominatim: Mock
-) -> None:
+async def test_async_get_weather_by_coordinates_success(mock_get: Mock) -> None:
     """Test AsyncWeatherClient.get_weather_by_coordinates with successful geocoding."""
-    from backend.client import AsyncWeatherClient
+    from backend.client import NOMINATIM_REVERSE_URL, AsyncWeatherClient
 
-    # Mock geocoder
-    mock_location = Mock()
-    mock_location.raw = {"address": {"city": "London", "country": "United Kingdom"}}
-    mock_geocoder = Mock()
-    mock_geocoder.reverse.return_value = mock_location
-    mock_nominatim.return_value = mock_geocoder
+    # Mock reverse geocoding response
+    geocode_response = _nominatim_response(
+        {"address": {"city": "London", "country": "United Kingdom"}}
+    )
 
     # Mock HTTP response
     html = """
@@ -534,7 +868,9 @@ async def test_async_get_weather_by_coordinates_success(
     mock_response = Mock()
     mock_response.text = html
     mock_response.status_code = 200
-    mock_get.return_value = mock_response
+    mock_get.side_effect = lambda url, **kwargs: (
+        geocode_response if url == NOMINATIM_REVERSE_URL else mock_response
+    )
 
     async with AsyncWeatherClient() as client:
         weather = await client.get_weather_by_coordinates(51.5074, -0.1278)
@@ -546,14 +882,12 @@ async def test_async_get_weather_by_coordinates_success(
 
 
 @pytest.mark.asyncio
-@patch("backend.client.Nominatim")
-async def test_async_get_weather_by_coordinates_geocode_failure(mock_nominatim: Mock) -> None:
+@patch("backend.client.httpx.AsyncClient.get")
+async def test_async_get_weather_by_coordinates_geocode_failure(mock_get: Mock) -> None:
     """Test AsyncWeatherClient.get_weather_by_coordinates when geocoding fails."""
     from backend.client import AsyncWeatherClient
 
-    mock_geocoder = Mock()
-    mock_geocoder.reverse.return_value = None
-    mock_nominatim.return_value = mock_geocoder
+    mock_get.return_value = _nominatim_response({"error": "Unable to geocode"})
 
     async with AsyncWeatherClient() as client:
         with pytest.raises(
@@ -563,14 +897,12 @@ async def test_async_get_weather_by_coordinates_geocode_failure(mock_nominatim:
 
 
 @pytest.mark.asyncio
-@patch("backend.client.Nominatim")
-async def test_async_get_weather_by_coordinates_geocode_exception(mock_nominatim: Mock) -> None:
+@patch("backend.client.httpx.AsyncClient.get")
+async def test_async_get_weather_by_coordinates_geocode_exception(mock_get: Mock) -> None:
     """Test AsyncWeatherClient.get_weather_by_coordinates when geocoding raises exception."""
     from backend.client import AsyncWeatherClient
 
-    mock_geocoder = Mock()
-    mock_geocoder.reverse.side_effect = Exception("Geocoding API error")
-    mock_nominatim.return_value = mock_geocoder
+    mock_get.side_effect = httpx.ConnectError("Geocoding API error")
 
     async with AsyncWeatherClient() as client:
         with pytest.raises(WeatherError, match="Failed to reverse geocode coordinates"):
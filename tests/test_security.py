@@ -1,17 +1,67 @@
 """Security and fuzzing tests for the API."""
 
-import json
+import logging
 
+import orjson
 import pytest
 
 from backend.api.main import app
 from backend.api.services import validate_input
 from backend.api.testing import _TestClient
 
-
-@pytest.fixture
+SQLI_PAYLOADS = (
+    "1; DROP",  # Semicolon for command injection
+    "1 UNION",  # SQL UNION keyword
+    "admin\x00null",  # Null byte injection
+    "1; DROP TABLE users",
+    "admin'--",
+)
+XSS_PAYLOADS = (
+    "<script>alert('xss')</script>",
+    "<script>alert(1)</script>",
+    "javascript:alert(1)",
+    "<img src=x onerror=alert(1)>",
+)
+PATH_TRAVERSAL_PAYLOADS = (
+    "../../../etc/passwd",
+    "..\\..\\..\\windows\\system32",
+)
+COMMAND_INJECTION_PAYLOADS = (
+    "; ls -la",
+    "| cat /etc/passwd",
+    "`whoami`",
+    "$(cat /etc/passwd)",
+)
+
+
+def _assert_error_body(response):
+    """Check the raw response body is an error object, without decoding the JSON."""
+    # Error bodies are rendered compactly by orjson with "error" as the first top-level key
+    assert response.data.startswith(b'{"error":')
+
+
+def _error_body(response):
+    """Return the decoded JSON body of an error response, checking it names an error."""
+    data = orjson.loads(response.data)
+    assert "error" in data
+    return data
+
+
+@pytest.fixture(scope="module", autouse=True)
+def quiet_request_logs():
+    """Silence per-request API and HTTP client logging for the many requests sent here."""
+    loggers = [logging.getLogger(name) for name in ("backend.api", "httpx")]
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.ERROR)
+    yield
+    for logger, level in zip(loggers, levels, strict=True):
+        logger.setLevel(level)
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app."""
+    """Create one test client for the FastAPI app, shared by every test in this module."""
     with _TestClient(app) as client:
         yield client
 
@@ -35,32 +85,38 @@ class TestInputValidation:
         """Test empty string is rejected."""
         value, error = validate_input("", "city", 100)
         assert error is not None
-        assert "empty" in error.lower()
+        assert "empty" in error
 
     def test_none_value(self):
         """Test None is rejected."""
         value, error = validate_input(None, "city", 100)
         assert error is not None
-        assert "string" in error.lower()
+        assert "string" in error
 
     def test_whitespace_only(self):
         """Test whitespace-only string is rejected."""
         value, error = validate_input("   ", "city", 100)
         assert error is not None
-        assert "empty" in error.lower() or "whitespace" in error.lower()
+        assert "empty" in error or "whitespace" in error
+
+    def test_ascii_punctuation_allowed(self):
+        """Test the allowed ASCII punctuation passes validation."""
+        value, error = validate_input("Winston-Salem, N.C.", "city", 100)
+        assert error is None
+        assert value == "Winston-Salem, N.C."
 
     def test_exceeds_max_length(self):
         """Test string exceeding max length is rejected."""
         value, error = validate_input("A" * 101, "city", 100)
         assert error is not None
-        assert "length" in error.lower()
+        assert "length" in error
 
     def test_non_string_type(self):
         """Test non-string types are rejected."""
         for invalid_value in [12345, True, [], {}]:
             value, error = validate_input(invalid_value, "city", 100)  # type: ignore[arg-type]
             assert error is not None
-            assert "string" in error.lower()
+            assert "string" in error
 
     def test_special_characters_rejected(self):
         """Test dangerous special characters are rejected."""
@@ -74,7 +130,7 @@ class TestInputValidation:
         for dangerous in dangerous_inputs:
             value, error = validate_input(dangerous, "city", 100)
             assert error is not None
-            assert "invalid characters" in error.lower()
+            assert "invalid characters" in error
 
     def test_unicode_cities_allowed(self):
         """Test valid unicode city names are allowed."""
@@ -90,64 +146,40 @@ class TestInputValidation:
             # These should pass as they contain valid unicode letters
             if error:
                 # Some special chars might not pass, that's ok for security
-                assert "invalid characters" in error.lower()
+                assert "invalid characters" in error
 
 
 class TestAPISecurityGET:
     """Test GET endpoint security."""
 
-    def test_sql_injection_attempts(self, client):
+    @pytest.mark.parametrize("payload", SQLI_PAYLOADS)
+    def test_sql_injection_attempts(self, client, payload):
         """Test SQL injection attempts are blocked."""
-        sql_injections = [
-            "1; DROP",  # Semicolon for command injection
-            "1 UNION",  # SQL UNION keyword
-            "admin\x00null",  # Null byte injection
-        ]
-        for payload in sql_injections:
-            response = client.get(f"/api/v1/weather?city={payload}&country={payload}")
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
-            assert "invalid" in data["message"].lower()
+        response = client.get("/api/v1/weather", params={"city": payload, "country": payload})
+        assert response.status_code == 400
+        data = _error_body(response)
+        assert data["error"] == "Invalid input"
 
-    def test_xss_attempts(self, client):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_xss_attempts(self, client, payload):
         """Test XSS attempts are blocked."""
-        xss_attempts = [
-            "<script>alert('xss')</script>",
-            "javascript:alert(1)",
-            "<img src=x onerror=alert(1)>",
-        ]
-        for payload in xss_attempts:
-            response = client.get(f"/api/v1/weather?city={payload}&country={payload}")
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
+        response = client.get("/api/v1/weather", params={"city": payload, "country": payload})
+        assert response.status_code == 400
+        _assert_error_body(response)
 
-    def test_path_traversal_attempts(self, client):
+    @pytest.mark.parametrize("payload", PATH_TRAVERSAL_PAYLOADS)
+    def test_path_traversal_attempts(self, client, payload):
         """Test path traversal attempts are blocked."""
-        path_traversals = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32",
-        ]
-        for payload in path_traversals:
-            response = client.get(f"/api/v1/weather?city={payload}&country={payload}")
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
+        response = client.get("/api/v1/weather", params={"city": payload, "country": payload})
+        assert response.status_code == 400
+        _assert_error_body(response)
 
-    def test_command_injection_attempts(self, client):
+    @pytest.mark.parametrize("payload", COMMAND_INJECTION_PAYLOADS)
+    def test_command_injection_attempts(self, client, payload):
         """Test command injection attempts are blocked."""
-        commands = [
-            "; ls -la",
-            "| cat /etc/passwd",
-            "`whoami`",
-            "$(cat /etc/passwd)",
-        ]
-        for payload in commands:
-            response = client.get(f"/api/v1/weather?city={payload}&country={payload}")
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
+        response = client.get("/api/v1/weather", params={"city": payload, "country": payload})
+        assert response.status_code == 400
+        _assert_error_body(response)
 
     def test_null_bytes(self, client):
         """Test null bytes are blocked."""
@@ -157,104 +189,105 @@ class TestAPISecurityGET:
     def test_oversized_input(self, client):
         """Test oversized inputs are rejected."""
         oversized = "A" * 10000
-        response = client.get(f"/api/v1/weather?city={oversized}&country={oversized}")
+        response = client.get("/api/v1/weather", params={"city": oversized, "country": oversized})
         assert response.status_code == 400
-        data = json.loads(response.data)
-        assert "error" in data
-        assert "length" in data["message"].lower()
+        data = _error_body(response)
+        assert "length" in data["message"]
 
     def test_empty_parameters(self, client):
         """Test empty parameters are rejected."""
         response = client.get("/api/v1/weather?city=&country=")
         assert response.status_code == 400
-        data = json.loads(response.data)
-        assert "error" in data
+        _assert_error_body(response)
 
     def test_whitespace_only_parameters(self, client):
         """Test whitespace-only parameters are rejected."""
         response = client.get("/api/v1/weather?city=   &country=   ")
         assert response.status_code == 400
-        data = json.loads(response.data)
-        assert "error" in data
+        _assert_error_body(response)
 
 
 class TestAPISecurityPOST:
     """Test POST endpoint security."""
 
-    def test_malformed_json(self, client):
-        """Test malformed JSON is handled gracefully."""
-        malformed = [
+    @pytest.mark.parametrize(
+        "payload",
+        [
             "{invalid json}",
             '{"city": "test"',  # Missing closing brace
             '{"city": "test", "country":}',  # Missing value
-        ]
-        for payload in malformed:
-            response = client.post(
-                "/api/v1/weather",
-                data=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
+        ],
+    )
+    def test_malformed_json(self, client, payload):
+        """Test malformed JSON is handled gracefully."""
+        response = client.post(
+            "/api/v1/weather",
+            data=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
+        _assert_error_body(response)
 
-    def test_non_string_types(self, client):
-        """Test non-string types in JSON are rejected."""
-        invalid_types = [
+    @pytest.mark.parametrize(
+        "payload",
+        [
             {"city": 12345, "country": "USA"},
             {"city": "Seattle", "country": True},
             {"city": [], "country": "USA"},
             {"city": "Seattle", "country": {}},
             {"city": None, "country": None},
-        ]
-        for payload in invalid_types:
-            response = client.post(
-                "/api/v1/weather",
-                json=payload,
-            )
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
-            # Should reject either because required or wrong type
-            assert "required" in data["message"].lower() or "string" in data["message"].lower()
+        ],
+    )
+    def test_non_string_types(self, client, payload):
+        """Test non-string types in JSON are rejected."""
+        response = client.post(
+            "/api/v1/weather",
+            json=payload,
+        )
+        assert response.status_code == 400
+        data = _error_body(response)
+        # Should reject either because required or wrong type
+        assert "required" in data["message"] or "string" in data["message"]
 
-    def test_sql_injection_in_json(self, client):
+    @pytest.mark.parametrize("payload", SQLI_PAYLOADS)
+    def test_sql_injection_in_json(self, client, payload):
         """Test SQL injection in JSON values is blocked."""
         response = client.post(
             "/api/v1/weather",
-            json={"city": "1; DROP TABLE users", "country": "admin'--"},
+            json={"city": payload, "country": "USA"},
+        )
+        assert response.status_code == 400
+        _assert_error_body(response)
+
+    @pytest.mark.parametrize("payload", SQLI_PAYLOADS)
+    def test_sql_injection_in_json_country(self, client, payload):
+        """Test SQL injection in the JSON country value is blocked."""
+        response = client.post(
+            "/api/v1/weather",
+            json={"city": "Seattle", "country": payload},
         )
         assert response.status_code == 400
-        data = json.loads(response.data)
-        assert "error" in data
+        _assert_error_body(response)
 
-    def test_xss_in_json(self, client):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_xss_in_json(self, client, payload):
         """Test XSS in JSON values is blocked."""
         response = client.post(
             "/api/v1/weather",
-            json={"city": "<script>alert(1)</script>", "country": "USA"},
+            json={"city": payload, "country": "USA"},
         )
         assert response.status_code == 400
-        data = json.loads(response.data)
-        assert "error" in data
+        _assert_error_body(response)
 
-    def test_non_dict_json(self, client):
+    @pytest.mark.parametrize("payload", [[], "string", 123, None, True])
+    def test_non_dict_json(self, client, payload):
         """Test non-dict JSON is rejected."""
-        invalid_json = [
-            [],
-            "string",
-            123,
-            None,
-            True,
-        ]
-        for payload in invalid_json:
-            response = client.post(
-                "/api/v1/weather",
-                json=payload,
-            )
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
+        response = client.post(
+            "/api/v1/weather",
+            json=payload,
+        )
+        assert response.status_code == 400
+        _assert_error_body(response)
 
     def test_oversized_json_values(self, client):
         """Test oversized JSON values are rejected."""
@@ -262,10 +295,10 @@ class TestAPISecurityPOST:
             "/api/v1/weather",
             json={"city": "A" * 10000, "country": "USA"},
         )
-        assert response.status_code == 400
-        data = json.loads(response.data)
-        assert "error" in data
-        assert "length" in data["message"].lower()
+        assert response.status_code == 413
+        data = _error_body(response)
+        assert data["error"] == "Request body too large"
+        assert "length" in data["message"]
 
 
 class TestAPIRateLimiting:
@@ -310,7 +343,7 @@ class TestHTTPErrorHandlers:
         huge_payload = {"city": "X" * 1_000_000, "country": "Y" * 1_000_000}
         response = client.post(
             "/api/v1/weather",
-            data=json.dumps(huge_payload),
+            data=orjson.dumps(huge_payload),
             content_type="application/json",
         )
         # Should be rejected (400 from validation or 413 from server)
@@ -330,8 +363,7 @@ class TestHTTPErrorHandlers:
                 json=payload,
             )
             assert response.status_code == 400
-            data = json.loads(response.data)
-            assert "error" in data
+            _assert_error_body(response)
 
     def test_415_unsupported_media_type(self, client):
         """Test 415 error for unsupported content types."""
@@ -452,7 +484,7 @@ class TestHTTPErrorHandlers:
         assert response.status_code in (200, 400, 500, 502)  # 500/502 if MSN Weather fails
         # Verify it's not a validation error
         if response.status_code == 400:
-            data = json.loads(response.data)
+            data = orjson.loads(response.data)
             # Should not be rejected for invalid characters
             assert "invalid characters" not in data.get("message", "").lower()
 
@@ -460,7 +492,7 @@ class TestHTTPErrorHandlers:
         response = client.get("/api/v1/weather?city=New%20York&country=USA")
         assert response.status_code in (200, 400, 500, 502)  # 500/502 if MSN Weather fails
         if response.status_code == 400:
-            data = json.loads(response.data)
+            data = orjson.loads(response.data)
             assert "invalid characters" not in data.get("message", "").lower()
 
     def test_repeated_parameters(self, client):